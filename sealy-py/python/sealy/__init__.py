@@ -1,16 +1,18 @@
 # re-exporting the modules from sealy
 
+from sealy.context import Context
 from sealy.parameters import (BfvEncryptionParametersBuilder,
                               CkksEncryptionParametersBuilder)
-from sealy.sealy import (AsymmetricComponents, BFVEncoder, BFVEvaluator,
-                         Ciphertext, CiphertextTensor, CKKSEncoder,
-                         CKKSEvaluator, CKKSTensorEncoder, CKKSTensorEvaluator,
-                         CoefficientModulus, Context, Decryptor, DegreeType,
-                         EncryptionParameters, Encryptor, GaloisKey,
-                         KeyGenerator, MemoryPool, Modulus, PlainModulus,
-                         Plaintext, PlaintextTensor, PolynomialArray,
-                         PublicKey, RelinearizationKey, SchemeType, SecretKey,
-                         SecurityLevel, TensorDecryptor, TensorEncryptor)
+from sealy.sealy import (HEXL_ENABLED, AsymmetricComponents, BFVEncoder,
+                         BFVEvaluator, Ciphertext, CiphertextTensor,
+                         CKKSEncoder, CKKSEvaluator, CKKSTensorEncoder,
+                         CKKSTensorEvaluator, CoefficientModulus, Decryptor,
+                         DegreeType, EncryptionParameters, Encryptor,
+                         GaloisKey, KeyGenerator, MemoryPool, Modulus,
+                         PlainModulus, Plaintext, PlaintextTensor,
+                         PolynomialArray, PublicKey, RelinearizationKey,
+                         SchemeType, SecretKey, SecurityLevel, TensorDecryptor,
+                         TensorEncryptor)
 
 __all__ = [
     "BfvEncryptionParametersBuilder",
@@ -37,7 +39,6 @@ __all__ = [
     "CKKSEncoder",
     "TensorEncryptor",
     "TensorDecryptor",
-    "TensorDecryptor",
     "CiphertextTensor",
     "PlaintextTensor",
     "CKKSTensorEncoder",
@@ -46,4 +47,5 @@ __all__ = [
     "SecretKey",
     "GaloisKey",
     "RelinearizationKey",
+    "HEXL_ENABLED",
 ]
@@ -0,0 +1,113 @@
+import struct
+import weakref
+from functools import cached_property
+from typing import Tuple
+
+from sealy.sealy import Context as _Context
+from sealy.sealy import EncryptionParameters, SchemeType, SecurityLevel
+
+_ContextKey = Tuple[bytes, bool, int]
+
+# Header of Context.dumps: scheme type, expand_mod_chain and security level,
+# followed by the serialized encryption parameters.
+_HEADER = struct.Struct("<B?i")
+
+# Live contexts, keyed by their class, serialized parameters and construction
+# flags.
+_interned: "weakref.WeakValueDictionary[Tuple[type, _ContextKey], Context]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _context_key(
+    params: EncryptionParameters,
+    expand_mod_chain: bool,
+    security_level: SecurityLevel,
+) -> _ContextKey:
+    return (
+        params.to_bytes(),
+        expand_mod_chain,
+        security_level.get_value(),
+    )
+
+
+class Context(_Context):
+    """
+    Performs sanity checks (validation) and pre-computations for a given set of
+    encryption parameters.
+
+    Contexts are interned by their parameters: constructing or unpickling a
+    context while an identical one is still alive returns that instance, so
+    the pre-computed tables (e.g. the NTT tables of every prime in the
+    coefficient modulus) are shared instead of being rebuilt.
+    """
+
+    expand_mod_chain: bool
+
+    def __new__(
+        cls,
+        params: EncryptionParameters,
+        expand_mod_chain: bool,
+        security_level: SecurityLevel,
+    ) -> "Context":
+        key = (cls, _context_key(params, expand_mod_chain, security_level))
+        ctx = _interned.get(key)
+        if ctx is None:
+            ctx = super().__new__(cls, params, expand_mod_chain, security_level)
+            ctx.expand_mod_chain = expand_mod_chain
+            _interned[key] = ctx
+        return ctx
+
+    # A context never changes after construction, so its parms ids are read
+    # from SEAL once instead of being copied out on every access.
+
+    @cached_property
+    def key_parms_id(self) -> Tuple[int, ...]:
+        """The parms id of the key level of the modulus switching chain."""
+        return tuple(self.get_key_parms_id())
+
+    @cached_property
+    def first_parms_id(self) -> Tuple[int, ...]:
+        """The parms id of the first data level of the modulus switching chain."""
+        return tuple(self.get_first_parms_id())
+
+    @cached_property
+    def last_parms_id(self) -> Tuple[int, ...]:
+        """The parms id of the last level of the modulus switching chain."""
+        return tuple(self.get_last_parms_id())
+
+    def dumps(self) -> bytes:
+        """
+        Serializes the context into bytes.
+
+        Only the encryption parameters and construction flags are stored; the
+        pre-computations are redone (or shared) by `Context.loads`.
+        """
+        params = self.get_encryption_parameters()
+        header = _HEADER.pack(
+            params.get_scheme().get_value(),
+            self.expand_mod_chain,
+            self.get_security_level().get_value(),
+        )
+        return header + params.to_bytes()
+
+    @classmethod
+    def loads(cls, data: bytes) -> "Context":
+        """Deserializes a context serialized with `Context.dumps`."""
+        scheme, expand_mod_chain, security_level = _HEADER.unpack_from(data)
+
+        params = EncryptionParameters.from_bytes(
+            SchemeType(scheme), data[_HEADER.size :]
+        )
+
+        return cls(params, expand_mod_chain, SecurityLevel(security_level))
+
+    def __reduce__(self) -> Tuple[type, Tuple[object, ...]]:
+        return (
+            type(self),
+            (
+                self.get_encryption_parameters(),
+                self.expand_mod_chain,
+                self.get_security_level(),
+            ),
+        )
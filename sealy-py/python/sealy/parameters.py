@@ -1,11 +1,38 @@
-from typing import List
+from typing import Callable, Dict, List, Type, Union
 
 from sealy.sealy import DegreeType, EncryptionParameters, Modulus, SchemeType
 
+_BFV_SCHEME = SchemeType.bfv()
+_CKKS_SCHEME = SchemeType.ckks()
+
+# Setter used by the BFV builder for each accepted plain modulus type.
+_PLAIN_MODULUS_SETTERS: Dict[Type, Callable[[EncryptionParameters, object], None]] = {
+    Modulus: EncryptionParameters.set_plain_modulus,
+    int: EncryptionParameters.set_plain_modulus_constant,
+}
+
+_NOT_A_DEGREE_TYPE = "poly_modulus_degree must be a DegreeType"
+_NOT_A_MODULUS_LIST = "coeff_modulus must be a list of Modulus"
+_NOT_A_PLAIN_MODULUS = "plain_modulus must be Modulus or int"
+
+
+def _check_poly_modulus_degree(poly_modulus_degree: DegreeType) -> None:
+    if not isinstance(poly_modulus_degree, DegreeType):
+        raise ValueError(_NOT_A_DEGREE_TYPE)
+
+
+def _check_coeff_modulus(coeff_modulus: List[Modulus]) -> None:
+    if not isinstance(coeff_modulus, (list, tuple)) or not all(
+        isinstance(modulus, Modulus) for modulus in coeff_modulus
+    ):
+        raise ValueError(_NOT_A_MODULUS_LIST)
+
 
 class BfvEncryptionParametersBuilder:
     """Constructs BFV encryption"""
 
+    __slots__ = ("poly_modulus_degree", "coeff_modulus", "plain_modulus")
+
     def __init__(self) -> None:
         """Initializes a new instance of the BfvEncryptionParametersBuilder class."""
         self.poly_modulus_degree = None
@@ -16,6 +43,7 @@ class BfvEncryptionParametersBuilder:
         self, poly_modulus_degree: DegreeType
     ) -> "BfvEncryptionParametersBuilder":
         """Sets the polynomial degree of the underlying BFV scheme."""
+        _check_poly_modulus_degree(poly_modulus_degree)
         self.poly_modulus_degree = poly_modulus_degree
         return self
 
@@ -23,6 +51,7 @@ class BfvEncryptionParametersBuilder:
         self, coeff_modulus: List[Modulus]
     ) -> "BfvEncryptionParametersBuilder":
         """Sets the coefficient modulus for the encryption scheme."""
+        _check_coeff_modulus(coeff_modulus)
         self.coeff_modulus = coeff_modulus
         return self
 
@@ -30,39 +59,45 @@ class BfvEncryptionParametersBuilder:
         self, plain_modulus: Modulus
     ) -> "BfvEncryptionParametersBuilder":
         """Sets the plaintext modulus for the encryption scheme."""
-        self.plain_modulus = plain_modulus
-        return self
+        return self._with_plain_modulus(plain_modulus)
 
     def with_plain_modulus_constant(
         self, plain_modulus: int
     ) -> "BfvEncryptionParametersBuilder":
         """Sets the plaintext modulus for the encryption scheme."""
-        self.plain_modulus = Modulus(plain_modulus)
+        return self._with_plain_modulus(Modulus(plain_modulus))
+
+    def _with_plain_modulus(
+        self, plain_modulus: Union[Modulus, int]
+    ) -> "BfvEncryptionParametersBuilder":
+        if type(plain_modulus) not in _PLAIN_MODULUS_SETTERS:
+            raise ValueError(_NOT_A_PLAIN_MODULUS)
+
+        self.plain_modulus = plain_modulus
         return self
 
     def build(self) -> EncryptionParameters:
         """Builds a new instance of the BfvEncryptionParameters class."""
-        params = EncryptionParameters(SchemeType.bfv())
-
-        if self.poly_modulus_degree is not None:
-            params.set_poly_modulus_degree(self.poly_modulus_degree)
-        else:
+        # The fields are public, so they may have been assigned directly
+        # instead of through the with_* setters and are checked again here.
+        if self.poly_modulus_degree is None:
             raise ValueError("poly_modulus_degree cannot be None")
+        _check_poly_modulus_degree(self.poly_modulus_degree)
 
-        if self.coeff_modulus is not None:
-            params.set_coefficient_modulus(self.coeff_modulus)
-        else:
+        if self.coeff_modulus is None:
             raise ValueError("coeff_modulus cannot be None")
+        _check_coeff_modulus(self.coeff_modulus)
 
-        if self.plain_modulus is not None:
-            if isinstance(self.plain_modulus, Modulus):
-                params.set_plain_modulus(self.plain_modulus)
-            elif isinstance(self.plain_modulus, int):
-                params.set_plain_modulus_constant(self.plain_modulus)
-            else:
-                raise ValueError("plain_modulus must be Modulus or int")
-        else:
+        if self.plain_modulus is None:
             raise ValueError("plain_modulus cannot be None")
+        set_plain_modulus = _PLAIN_MODULUS_SETTERS.get(type(self.plain_modulus))
+        if set_plain_modulus is None:
+            raise ValueError(_NOT_A_PLAIN_MODULUS)
+
+        params = EncryptionParameters(_BFV_SCHEME)
+        params.set_poly_modulus_degree(self.poly_modulus_degree)
+        params.set_coefficient_modulus(self.coeff_modulus)
+        set_plain_modulus(params, self.plain_modulus)
 
         return params
 
@@ -70,6 +105,8 @@ class BfvEncryptionParametersBuilder:
 class CkksEncryptionParametersBuilder:
     """Constructs CKKS encryption"""
 
+    __slots__ = ("poly_modulus_degree", "coeff_modulus")
+
     def __init__(self) -> None:
         """Initializes a new instance of the CkksEncryptionParametersBuilder class."""
         self.poly_modulus_degree = None
@@ -79,6 +116,7 @@ class CkksEncryptionParametersBuilder:
         self, poly_modulus_degree: DegreeType
     ) -> "CkksEncryptionParametersBuilder":
         """Sets the polynomial degree of the underlying CKKS scheme."""
+        _check_poly_modulus_degree(poly_modulus_degree)
         self.poly_modulus_degree = poly_modulus_degree
         return self
 
@@ -86,21 +124,23 @@ class CkksEncryptionParametersBuilder:
         self, coeff_modulus: List[Modulus]
     ) -> "CkksEncryptionParametersBuilder":
         """Sets the coefficient modulus for the encryption scheme."""
+        _check_coeff_modulus(coeff_modulus)
         self.coeff_modulus = coeff_modulus
         return self
 
     def build(self) -> EncryptionParameters:
         """Builds a new instance of the CkksEncryptionParameters class."""
-        params = EncryptionParameters(SchemeType.ckks())
-
-        if self.poly_modulus_degree is not None:
-            params.set_poly_modulus_degree(self.poly_modulus_degree)
-        else:
+        # See BfvEncryptionParametersBuilder.build.
+        if self.poly_modulus_degree is None:
             raise ValueError("poly_modulus_degree cannot be None")
+        _check_poly_modulus_degree(self.poly_modulus_degree)
 
-        if self.coeff_modulus is not None:
-            params.set_coefficient_modulus(self.coeff_modulus)
-        else:
+        if self.coeff_modulus is None:
             raise ValueError("coeff_modulus cannot be None")
+        _check_coeff_modulus(self.coeff_modulus)
+
+        params = EncryptionParameters(_CKKS_SCHEME)
+        params.set_poly_modulus_degree(self.poly_modulus_degree)
+        params.set_coefficient_modulus(self.coeff_modulus)
 
         return params
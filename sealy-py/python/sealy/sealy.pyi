@@ -1,4 +1,10 @@
-from typing import List, Tuple
+from typing import Any, List, Tuple
+
+import numpy as np
+from numpy.typing import NDArray
+
+HEXL_ENABLED: bool
+"""Whether SEAL was built against Intel HEXL (the ``hexl`` feature)."""
 
 class MemoryPool:
     """
@@ -42,6 +48,14 @@ class SchemeType:
         """
         ...
 
+    def get_value(self) -> int:
+        """
+        Get the numeric value of the scheme type.
+
+        :return: The value accepted by the SchemeType constructor.
+        """
+        ...
+
 class CoefficientModulus:
     """
     Represents the coefficient modulus used in encryption parameters.
@@ -54,6 +68,10 @@ class CoefficientModulus:
         """
         Initialize a new coefficient modulus with a given degree and bit sizes.
 
+        The primes found for recently used arguments are cached, so repeated
+        calls skip the prime search. Every call still returns a new list of
+        new moduli, which the caller is free to modify.
+
         :param degree: The polynomial degree.
         :param bit_sizes: A list of bit sizes for the moduli.
         :return: A list of moduli.
@@ -283,6 +301,25 @@ class EncryptionParameters:
         """
         ...
 
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the encryption parameters into bytes.
+
+        :return: The serialized encryption parameters.
+        """
+        ...
+
+    @classmethod
+    def from_bytes(cls, scheme: SchemeType, data: bytes) -> "EncryptionParameters":
+        """
+        Deserialize encryption parameters serialized with `to_bytes`.
+
+        :param scheme: The scheme type of the encryption parameters.
+        :param data: The serialized encryption parameters.
+        :return: The deserialized encryption parameters.
+        """
+        ...
+
 class Context:
     """
     Represents the context used in encryption parameters.
@@ -651,6 +688,14 @@ class Ciphertext:
         """
         ...
 
+    def shape(self) -> Tuple[int, int]:
+        """
+        Get the number of polynomials and the coefficient modulus size of the ciphertext.
+
+        :return: A tuple (num_polynomials, coeff_modulus_size).
+        """
+        ...
+
     def is_ntt_form(self) -> bool:
         """
         Check if the ciphertext is in NTT form.
@@ -727,8 +772,8 @@ class PolynomialArray:
         modulus."""
         ...
 
-    def as_ints(self) -> List[int]:
-        """Returns the array as a list of integers."""
+    def as_ints(self) -> NDArray[np.uint64]:
+        """Returns the array as a NumPy array of unsigned 64-bit integers."""
         ...
 
     def get_num_polynomials(self) -> int:
@@ -743,6 +788,10 @@ class PolynomialArray:
         """Returns how many moduli are in the coefficient modulus set."""
         ...
 
+    def shape(self) -> Tuple[int, int, int]:
+        """Returns (num_polynomials, poly_modulus_degree, coeff_modulus_size)."""
+        ...
+
     def drop_modulus(self) -> "PolynomialArray":
         """Reduces the polynomial array by dropping the last modulus in the modulus
         set."""
@@ -779,6 +828,20 @@ class BFVEncoder:
         """
         ...
 
+    def encode_int_buffer(self, data: Any) -> "Plaintext":
+        """
+        Encodes the given buffer into a plaintext without converting each
+        element to a Python object first.
+
+        Parameters:
+        data (Any): An object exposing the buffer protocol with 64-bit signed
+            integer items, e.g. a NumPy ``int64`` array or ``array.array("q")``.
+
+        Returns:
+        Plaintext: The encoded plaintext.
+        """
+        ...
+
     def decode_int(self, plaintext: "Plaintext") -> List[int]:
         """
         Decodes the given plaintext into data.
@@ -849,6 +912,33 @@ class CKKSEncoder:
         """
         ...
 
+    def encode_scalar(self, value: float) -> "Plaintext":
+        """
+        Encodes the given value into every slot of a plaintext, without
+        the transforms needed to encode a full vector.
+
+        Parameters:
+        value (float): The value to encode.
+
+        Returns:
+        Plaintext: The encoded plaintext.
+        """
+        ...
+
+    def encode_float_buffer(self, data: Any) -> "Plaintext":
+        """
+        Encodes the given buffer into a plaintext without converting each
+        element to a Python object first.
+
+        Parameters:
+        data (Any): An object exposing the buffer protocol with 64-bit float
+            items, e.g. a NumPy ``float64`` array or ``array.array("d")``.
+
+        Returns:
+        Plaintext: The encoded plaintext.
+        """
+        ...
+
     def decode_float(self, plaintext: "Plaintext") -> List[float]:
         """
         Decodes the given plaintext into data.
@@ -936,6 +1026,18 @@ class Encryptor:
         """
         ...
 
+    def encrypt_many(self, plaintexts: List["Plaintext"]) -> List["Ciphertext"]:
+        """
+        Encrypts the given plaintexts in parallel.
+
+        Parameters:
+        plaintexts (List[Plaintext]): The plaintexts to encrypt.
+
+        Returns:
+        List[Ciphertext]: The encrypted ciphertexts, in the same order.
+        """
+        ...
+
     def encrypt_return_components(
         self, plaintext: "Plaintext"
     ) -> Tuple["Ciphertext", "AsymmetricComponents"]:
@@ -1289,6 +1391,21 @@ class CiphertextTensor:
         """
         ...
 
+    def __array__(
+        self, dtype: Any = None, copy: Any = None
+    ) -> NDArray[np.uint64]:
+        """
+        Copies the coefficients of every ciphertext into a NumPy array, so that
+        ``np.asarray(tensor)`` works. SEAL does not expose the memory behind a
+        ciphertext, so the array is always a copy, and it is read out one
+        coefficient at a time: expect it to be slow for large tensors.
+
+        Returns:
+        NDArray[np.uint64]: The coefficients, with shape
+            ``(chunks, polynomials, coeff_modulus_size, poly_modulus_degree)``.
+        """
+        ...
+
     def to_bytes_chunk(self) -> List[bytes]:
         """
         Convert the ciphertexts to a list of bytes.
@@ -1333,6 +1450,20 @@ class TensorEncryptor:
         """
         ...
 
+    def encrypt_many(
+        self, plaintexts: List["PlaintextTensor"]
+    ) -> List["CiphertextTensor"]:
+        """
+        Encrypts several batches of plaintexts in parallel.
+
+        Parameters:
+        plaintexts (List[PlaintextTensor]): The batches to encrypt.
+
+        Returns:
+        List[CiphertextTensor]: The encrypted batches, in the same order.
+        """
+        ...
+
 class TensorDecryptor:
     """
     Decrypts a batch of ciphertexts into a batch of plaintexts.
@@ -1387,6 +1518,34 @@ class CKKSTensorEncoder:
         """
         ...
 
+    def encode_float_buffer(self, data: Any) -> "PlaintextTensor":
+        """
+        Encodes the given buffer without converting each element to a Python
+        object first.
+
+        Parameters:
+        data (Any): An object exposing the buffer protocol with 64-bit float
+            items, e.g. a NumPy ``float64`` array or ``array.array("d")``.
+
+        Returns:
+        PlaintextTensor: The encoded plaintexts.
+        """
+        ...
+
+    def encode_batch(self, data: List[Any]) -> List["PlaintextTensor"]:
+        """
+        Encodes multiple tensors in parallel.
+
+        Parameters:
+        data (List[Any]): The tensors to encode, each an object exposing the
+            buffer protocol with 64-bit float items, e.g. a NumPy ``float64``
+            array or ``array.array("d")``.
+
+        Returns:
+        List[PlaintextTensor]: The encoded tensors, in the same order.
+        """
+        ...
+
     def decode_float(self, plaintexts: "PlaintextTensor") -> List[float]:
         """
         Decodes the given batch of plaintexts.
@@ -1454,6 +1613,51 @@ class CKKSTensorEvaluator:
         """
         ...
 
+    def add_many_into(
+        self, ciphertexts: List["CiphertextTensor"], out: "CiphertextTensor"
+    ) -> None:
+        """
+        Adds multiple batches of ciphertexts, overwriting `out` with the sum.
+        Reusing `out` across calls reuses its ciphertext allocations.
+
+        Parameters:
+        ciphertexts (List[CiphertextTensor]): The batches of ciphertexts to add.
+        out (CiphertextTensor): The batch the sum is written to.
+        """
+        ...
+
+    def mean(
+        self,
+        ciphertexts: List["CiphertextTensor"],
+        encoder: "CKKSTensorEncoder",
+    ) -> "CiphertextTensor":
+        """
+        Computes the element-wise mean of multiple batches of ciphertexts.
+
+        Parameters:
+        ciphertexts (List[CiphertextTensor]): The batches of ciphertexts to average.
+        encoder (CKKSTensorEncoder): The encoder used to encode 1 / len(ciphertexts).
+
+        Returns:
+        CiphertextTensor: The mean of the ciphertexts.
+        """
+        ...
+
+    def add_many_multiply_plain(
+        self, ciphertexts: List["CiphertextTensor"], plaintext: "Plaintext"
+    ) -> "CiphertextTensor":
+        """
+        Adds multiple batches of ciphertexts and multiplies every chunk of the sum by a plaintext.
+
+        Parameters:
+        ciphertexts (List[CiphertextTensor]): The batches of ciphertexts to add.
+        plaintext (Plaintext): The plaintext each chunk of the sum is multiplied by.
+
+        Returns:
+        CiphertextTensor: The scaled sum of the ciphertexts.
+        """
+        ...
+
     def multiply(
         self, a: "CiphertextTensor", b: "CiphertextTensor"
     ) -> "CiphertextTensor":
@@ -0,0 +1,98 @@
+from typing import Callable, NamedTuple, Tuple
+
+import pytest
+from sealy import (BFVEncoder, BfvEncryptionParametersBuilder, BFVEvaluator,
+                   CkksEncryptionParametersBuilder, CoefficientModulus,
+                   Context, Decryptor, DegreeType, Encryptor, KeyGenerator,
+                   PlainModulus, SecurityLevel)
+
+
+def make_bfv_context(
+    degree: int, bit_sizes: Tuple[int, ...], plain_modulus: int
+) -> Context:
+    """
+    Builds a BFV context with a constant plain modulus. Contexts are interned,
+    so asking again while an identical context is alive returns that one.
+    """
+    params = (
+        BfvEncryptionParametersBuilder()
+        .with_poly_modulus_degree(DegreeType(degree))
+        .with_coefficient_modulus(
+            CoefficientModulus.create(DegreeType(degree), list(bit_sizes))
+        )
+        .with_plain_modulus_constant(plain_modulus)
+        .build()
+    )
+
+    return Context(params, False, SecurityLevel(128))
+
+
+class BfvComponents(NamedTuple):
+    ctx: Context
+    encoder: BFVEncoder
+    gen: KeyGenerator
+    encryptor: Encryptor
+    decryptor: Decryptor
+    evaluator: BFVEvaluator
+
+
+def make_bfv_components(plain_modulus_bits: int) -> BfvComponents:
+    params = (
+        BfvEncryptionParametersBuilder()
+        .with_poly_modulus_degree(DegreeType(8192))
+        .with_coefficient_modulus(
+            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
+        )
+        .with_plain_modulus(
+            PlainModulus.batching(DegreeType(8192), plain_modulus_bits)
+        )
+        .build()
+    )
+
+    ctx = Context(params, False, SecurityLevel(128))
+    gen = KeyGenerator(ctx)
+
+    public_key = gen.create_public_key()
+    secret_key = gen.secret_key()
+
+    return BfvComponents(
+        ctx=ctx,
+        encoder=BFVEncoder(ctx),
+        gen=gen,
+        encryptor=Encryptor(ctx, public_key),
+        decryptor=Decryptor(ctx, secret_key),
+        evaluator=BFVEvaluator(ctx),
+    )
+
+
+# Building a context generates the NTT tables for every prime in the
+# coefficient modulus, so the setups below are shared by the whole session.
+
+
+@pytest.fixture(scope="session")
+def bfv_context_factory() -> Callable[..., Context]:
+    return make_bfv_context
+
+
+@pytest.fixture(scope="session")
+def bfv_batching20() -> BfvComponents:
+    return make_bfv_components(20)
+
+
+@pytest.fixture(scope="session")
+def bfv_batching32() -> BfvComponents:
+    return make_bfv_components(32)
+
+
+@pytest.fixture(scope="session")
+def ckks_context() -> Context:
+    params = (
+        CkksEncryptionParametersBuilder()
+        .with_poly_modulus_degree(DegreeType(8192))
+        .with_coefficient_modulus(
+            CoefficientModulus.create(DegreeType(8192), [60, 40, 40, 60])
+        )
+        .build()
+    )
+
+    return Context(params, False, SecurityLevel(128))
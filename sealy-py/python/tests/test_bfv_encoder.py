@@ -1,56 +1,24 @@
-from sealy import (BFVEncoder, BfvEncryptionParametersBuilder,
-                   CoefficientModulus, Context, DegreeType, PlainModulus,
-                   SecurityLevel)
-
-
-def test_can_create_and_drop_bfv_encoder():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus(PlainModulus.batching(DegreeType(8192), 20))
-        .build()
-    )
-
-    ctx = Context(params, False, SecurityLevel(128))
-    encoder = BFVEncoder(ctx)
-    del encoder
+from array import array
 
+import numpy as np
+from sealy import BFVEncoder
 
-def test_can_get_slots_bfv_encoder():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus(PlainModulus.batching(DegreeType(8192), 20))
-        .build()
-    )
 
-    ctx = Context(params, False, SecurityLevel(128))
-    encoder = BFVEncoder(ctx)
+def test_can_create_and_drop_bfv_encoder(bfv_batching20):
+    encoder = BFVEncoder(bfv_batching20.ctx)
+    del encoder
 
-    assert encoder.get_slot_count() == 8192
 
+def test_can_get_slots_bfv_encoder(bfv_batching20):
+    encoder = bfv_batching20.encoder
 
-def test_can_get_encode_and_decode_unsigned():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus(PlainModulus.batching(DegreeType(8192), 20))
-        .build()
-    )
+    assert encoder.get_slot_count() == 8192
 
-    ctx = Context(params, False, SecurityLevel(128))
-    encoder = BFVEncoder(ctx)
 
-    data = [i for i in range(encoder.get_slot_count())]
+def test_can_get_encode_and_decode_unsigned(bfv_batching20):
+    encoder = bfv_batching20.encoder
+
+    data = np.arange(encoder.get_slot_count(), dtype=np.int64).tolist()
 
     plaintext = encoder.encode_int(data)
     data_2 = encoder.decode_int(plaintext)
@@ -58,21 +26,10 @@ def test_can_get_encode_and_decode_unsigned():
     assert data == data_2
 
 
-def test_can_get_encode_and_decode_signed():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus(PlainModulus.batching(DegreeType(8192), 20))
-        .build()
-    )
-
-    ctx = Context(params, False, SecurityLevel(128))
-    encoder = BFVEncoder(ctx)
+def test_can_get_encode_and_decode_signed(bfv_batching20):
+    encoder = bfv_batching20.encoder
 
-    data = [i for i in range(encoder.get_slot_count())]
+    data = np.arange(encoder.get_slot_count(), dtype=np.int64).tolist()
 
     plaintext = encoder.encode_int(data)
     data_2 = encoder.decode_int(plaintext)
@@ -80,39 +37,33 @@ def test_can_get_encode_and_decode_signed():
     assert data == data_2
 
 
-def test_scalar_encoder_can_encode_decode_signed():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus(PlainModulus.batching(DegreeType(8192), 20))
-        .build()
-    )
-
-    ctx = Context(params, False, SecurityLevel(128))
-    encoder = BFVEncoder(ctx)
+def test_scalar_encoder_can_encode_decode_signed(bfv_batching20):
+    encoder = bfv_batching20.encoder
 
     p = encoder.encode_int([-15])
 
     assert encoder.decode_int(p)[0] == -15
 
 
-def test_scalar_encoder_can_encode_decode_unsigned():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus(PlainModulus.batching(DegreeType(8192), 20))
-        .build()
-    )
-
-    ctx = Context(params, False, SecurityLevel(128))
-    encoder = BFVEncoder(ctx)
+def test_scalar_encoder_can_encode_decode_unsigned(bfv_batching20):
+    encoder = bfv_batching20.encoder
 
     p = encoder.encode_int([42])
 
     assert encoder.decode_int(p)[0] == 42
+
+
+def test_can_encode_int_buffer(bfv_batching20):
+    encoder = bfv_batching20.encoder
+
+    data = np.arange(encoder.get_slot_count(), dtype=np.int64) - 4096
+
+    plaintext = encoder.encode_int_buffer(data)
+    assert encoder.decode_int(plaintext) == data.tolist()
+
+    # Non-contiguous buffers are copied before encoding.
+    plaintext = encoder.encode_int_buffer(data[::2])
+    assert encoder.decode_int(plaintext)[: len(data) // 2] == data[::2].tolist()
+
+    plaintext = encoder.encode_int_buffer(array("q", [42, -15]))
+    assert encoder.decode_int(plaintext)[:2] == [42, -15]
@@ -1,96 +1,67 @@
-from typing import Tuple
+from typing import List, NamedTuple
 
-from sealy import (BFVEncoder, BfvEncryptionParametersBuilder, BFVEvaluator,
-                   CoefficientModulus, Context, Decryptor, DegreeType,
-                   Encryptor, KeyGenerator, PlainModulus, SecurityLevel)
+import numpy as np
+import pytest
+from sealy import BFVEvaluator, Ciphertext, Plaintext
 
 
-def run_bfv_test() -> (
-    Tuple[
-        "Decryptor", "BFVEncoder", "Encryptor", "BFVEvaluator", "KeyGenerator"
-    ]
-):
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus(PlainModulus.batching(DegreeType(8192), 32))
-        .build()
-    )
+class EncryptedVec(NamedTuple):
+    vec: List[int]
+    encoded: Plaintext
+    encrypted: Ciphertext
 
-    ctx = Context(params, False, SecurityLevel(128))
-    gen = KeyGenerator(ctx)
 
-    encoder = BFVEncoder(ctx)
+def make_vec(encoder):
+    n = encoder.get_slot_count()
+    return (n // 2 - np.arange(n, dtype=np.int64)).tolist()
 
-    public_key = gen.create_public_key()
-    secret_key = gen.secret_key()
 
-    encryptor = Encryptor(ctx, public_key)
-    decryptor = Decryptor(ctx, secret_key)
-    evaluator = BFVEvaluator(ctx)
+def make_small_vec(encoder):
+    n = encoder.get_slot_count()
+    return (16 - np.arange(n, dtype=np.int64) % 32).tolist()
 
-    return (decryptor, encoder, encryptor, evaluator, gen)
 
+def encrypt_vec(components, vec) -> EncryptedVec:
+    encoded = components.encoder.encode_int(vec)
+    return EncryptedVec(vec, encoded, components.encryptor.encrypt(encoded))
 
-def make_vec(encoder):
-    return [
-        encoder.get_slot_count() // 2 - i
-        for i in range(encoder.get_slot_count())
-    ]
 
+# Encoding runs an NTT per prime in the coefficient modulus, so the operands
+# are encoded and encrypted once and shared by every test in this module.
 
-def make_small_vec(encoder):
-    return [16 - i % 32 for i in range(encoder.get_slot_count())]
-
-
-def test_can_create_and_destroy_evaluator():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus(PlainModulus.batching(DegreeType(8192), 32))
-        .build()
-    )
-
-    ctx = Context(params, False, SecurityLevel(128))
-    evaluator = BFVEvaluator(ctx)
-    del evaluator
 
+@pytest.fixture(scope="module")
+def bfv_vec_pair(bfv_batching32) -> EncryptedVec:
+    return encrypt_vec(bfv_batching32, make_vec(bfv_batching32.encoder))
 
-def test_can_negate():
-    decryptor, encoder, encryptor, evaluator, _ = run_bfv_test()
 
-    vec = make_vec(encoder)
-    encoded = encoder.encode_int(vec)
-    encrypted = encryptor.encrypt(encoded)
+@pytest.fixture(scope="module")
+def bfv_small_vec_pair(bfv_batching32) -> EncryptedVec:
+    return encrypt_vec(bfv_batching32, make_small_vec(bfv_batching32.encoder))
 
-    result = evaluator.negate(encrypted)
 
-    decrypted = decryptor.decrypt(result)
+def test_can_create_and_destroy_evaluator(bfv_batching32):
+    evaluator = BFVEvaluator(bfv_batching32.ctx)
+    del evaluator
 
-    decoded = encoder.decode_int(decrypted)
 
-    assert len(vec) == len(decoded)
-    for i in range(len(vec)):
-        assert vec[i] == -decoded[i]
+def test_can_negate(bfv_batching32, bfv_vec_pair):
+    _, encoder, _, _, decryptor, evaluator = bfv_batching32
+    vec, _, encrypted = bfv_vec_pair
 
+    result = evaluator.negate(encrypted)
 
-def test_can_add():
-    decryptor, encoder, encryptor, evaluator, _ = run_bfv_test()
+    decrypted = decryptor.decrypt(result)
+
+    decoded = encoder.decode_int(decrypted)
 
-    a = make_vec(encoder)
-    b = make_vec(encoder)
+    np.testing.assert_array_equal(decoded, -np.asarray(vec))
 
-    encoded_a = encoder.encode_int(a)
-    encoded_b = encoder.encode_int(b)
 
-    encrypted_a = encryptor.encrypt(encoded_a)
-    encrypted_b = encryptor.encrypt(encoded_b)
+def test_can_add(bfv_batching32, bfv_vec_pair):
+    _, encoder, _, _, decryptor, evaluator = bfv_batching32
+    a, _, encrypted_a = bfv_vec_pair
+    b, _, encrypted_b = bfv_vec_pair
 
     result = evaluator.add(encrypted_a, encrypted_b)
 
@@ -98,22 +69,13 @@ def test_can_add():
 
     decoded = encoder.decode_int(decrypted)
 
-    assert len(a) == len(decoded)
-    for i in range(len(a)):
-        assert a[i] + b[i] == decoded[i]
-
-
-def test_can_sub():
-    decryptor, encoder, encryptor, evaluator, _ = run_bfv_test()
+    np.testing.assert_array_equal(decoded, np.add(a, b))
 
-    a = make_vec(encoder)
-    b = make_vec(encoder)
 
-    encoded_a = encoder.encode_int(a)
-    encoded_b = encoder.encode_int(b)
-
-    encrypted_a = encryptor.encrypt(encoded_a)
-    encrypted_b = encryptor.encrypt(encoded_b)
+def test_can_sub(bfv_batching32, bfv_vec_pair):
+    _, encoder, _, _, decryptor, evaluator = bfv_batching32
+    a, _, encrypted_a = bfv_vec_pair
+    b, _, encrypted_b = bfv_vec_pair
 
     result = evaluator.sub(encrypted_a, encrypted_b)
 
@@ -121,22 +83,13 @@ def test_can_sub():
 
     decoded = encoder.decode_int(decrypted)
 
-    assert len(a) == len(decoded)
-    for i in range(len(a)):
-        assert a[i] - b[i] == decoded[i]
-
-
-def test_can_multiply():
-    decryptor, encoder, encryptor, evaluator, _ = run_bfv_test()
-
-    a = make_small_vec(encoder)
-    b = make_small_vec(encoder)
+    np.testing.assert_array_equal(decoded, np.subtract(a, b))
 
-    encoded_a = encoder.encode_int(a)
-    encoded_b = encoder.encode_int(b)
 
-    encrypted_a = encryptor.encrypt(encoded_a)
-    encrypted_b = encryptor.encrypt(encoded_b)
+def test_can_multiply(bfv_batching32, bfv_small_vec_pair):
+    _, encoder, _, _, decryptor, evaluator = bfv_batching32
+    a, _, encrypted_a = bfv_small_vec_pair
+    b, _, encrypted_b = bfv_small_vec_pair
 
     result = evaluator.multiply(encrypted_a, encrypted_b)
 
@@ -144,6 +97,4 @@ def test_can_multiply():
 
     decoded = encoder.decode_int(decrypted)
 
-    assert len(a) == len(decoded)
-    for i in range(len(a)):
-        assert a[i] * b[i] == decoded[i]
+    np.testing.assert_array_equal(decoded, np.multiply(a, b))
@@ -1,58 +1,63 @@
-from sealy import (CKKSEncoder, CkksEncryptionParametersBuilder,
-                   CoefficientModulus, Context, DegreeType, SecurityLevel)
-
-
-def test_can_create_and_drop_ckks_encoder():
-    params = (
-        CkksEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [60, 40, 40, 60])
-        )
-        .build()
-    )
+from array import array
+
+import numpy as np
+from sealy import CKKSEncoder
+
+
+def test_can_create_and_drop_ckks_encoder(ckks_context):
     scale = 2.0**40
 
-    ctx = Context(params, False, SecurityLevel(128))
-    encoder = CKKSEncoder(ctx, scale)
+    encoder = CKKSEncoder(ckks_context, scale)
     del encoder
 
 
-def test_can_get_slots_ckks_encoder():
-    params = (
-        CkksEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [60, 40, 40, 60])
-        )
-        .build()
-    )
+def test_can_get_slots_ckks_encoder(ckks_context):
     scale = 2.0**40
 
-    ctx = Context(params, False, SecurityLevel(128))
-    encoder = CKKSEncoder(ctx, scale)
+    encoder = CKKSEncoder(ckks_context, scale)
 
     assert encoder.get_slot_count() == 4096
 
 
-def test_can_get_encode_and_decode_float():
-    params = (
-        CkksEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [60, 40, 40, 60])
-        )
-        .build()
-    )
+def test_can_get_encode_and_decode_float(ckks_context):
     scale = 2.0**40
 
-    ctx = Context(params, False, SecurityLevel(128))
-    encoder = CKKSEncoder(ctx, scale)
+    encoder = CKKSEncoder(ckks_context, scale)
 
-    data = [i / 10 for i in range(encoder.get_slot_count())]
+    data = (np.arange(encoder.get_slot_count()) / 10).tolist()
 
     plaintext = encoder.encode_float(data)
     data_2 = encoder.decode_float(plaintext)
 
-    # assert float array with 1e-6 precision
-    assert all(abs(a - b) < 1e-6 for a, b in zip(data, data_2))
+    np.testing.assert_allclose(data_2, data, atol=1e-6)
+
+
+def test_can_encode_float_buffer(ckks_context):
+    scale = 2.0**40
+
+    encoder = CKKSEncoder(ckks_context, scale)
+
+    data = np.arange(encoder.get_slot_count(), dtype=np.float64) / 10
+
+    plaintext = encoder.encode_float_buffer(data)
+    data_2 = encoder.decode_float(plaintext)
+
+    np.testing.assert_allclose(data_2, data, atol=1e-6)
+
+    plaintext = encoder.encode_float_buffer(array("d", [0.5, -1.25]))
+    data_2 = encoder.decode_float(plaintext)
+
+    np.testing.assert_allclose(data_2[:2], [0.5, -1.25], atol=1e-6)
+
+
+def test_can_encode_scalar(ckks_context):
+    scale = 2.0**40
+
+    encoder = CKKSEncoder(ckks_context, scale)
+
+    plaintext = encoder.encode_scalar(1 / 3)
+    data = encoder.decode_float(plaintext)
+
+    np.testing.assert_allclose(
+        data, np.full(encoder.get_slot_count(), 1 / 3), atol=1e-6
+    )
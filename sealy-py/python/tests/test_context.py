@@ -19,3 +19,21 @@ def test_can_create_and_drop_context():
 
     # Drop context
     del ctx
+
+
+def test_identical_contexts_are_shared():
+    def make_params():
+        return (
+            BfvEncryptionParametersBuilder()
+            .with_poly_modulus_degree(DegreeType(1024))
+            .with_coefficient_modulus(
+                CoefficientModulus.create(DegreeType(1024), [60, 40, 40, 60])
+            )
+            .with_plain_modulus_constant(1234)
+            .build()
+        )
+
+    ctx = Context(make_params(), False, SecurityLevel(128))
+
+    assert Context(make_params(), False, SecurityLevel(128)) is ctx
+    assert Context(make_params(), True, SecurityLevel(128)) is not ctx
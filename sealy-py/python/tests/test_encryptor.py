@@ -1,19 +1,8 @@
-from sealy import (BfvEncryptionParametersBuilder, CoefficientModulus, Context,
-                   DegreeType, Encryptor, KeyGenerator, SecurityLevel)
+from sealy import Encryptor, KeyGenerator
 
 
-def test_can_create_and_drop_encryptor():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus_constant(1234)
-        .build()
-    )
-
-    ctx = Context(params, False, SecurityLevel(128))
+def test_can_create_and_drop_encryptor(bfv_context_factory):
+    ctx = bfv_context_factory(8192, (50, 30, 30, 50, 50), 1234)
 
     gen = KeyGenerator(ctx)
 
@@ -22,3 +11,16 @@ def test_can_create_and_drop_encryptor():
     encryptor = Encryptor(ctx, public_key)
 
     del encryptor
+
+
+def test_can_encrypt_many(bfv_batching20):
+    _, encoder, _, encryptor, decryptor, _ = bfv_batching20
+
+    data = [[i] * encoder.get_slot_count() for i in range(3)]
+    plaintexts = [encoder.encode_int(d) for d in data]
+
+    ciphertexts = encryptor.encrypt_many(plaintexts)
+
+    assert len(ciphertexts) == len(plaintexts)
+    for d, c in zip(data, ciphertexts):
+        assert encoder.decode_int(decryptor.decrypt(c)) == d
@@ -1,21 +1,19 @@
-import json
+import pytest
+from sealy import (BfvEncryptionParametersBuilder, CoefficientModulus,
+                   Context, DegreeType, KeyGenerator, PlainModulus,
+                   SecurityLevel)
 
-from sealy import (BfvEncryptionParametersBuilder, CoefficientModulus, Context,
-                   DegreeType, KeyGenerator, PlainModulus, SecurityLevel)
 
+# Creating a KeyGenerator samples a fresh secret key, so the tests that only
+# derive keys from it share a single generator.
+@pytest.fixture(scope="module")
+def shared_ctx_gen(bfv_context_factory):
+    ctx = bfv_context_factory(8192, (50, 30, 30, 50, 50), 1234)
+    return ctx, KeyGenerator(ctx)
 
-def test_can_create_secret_key():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus_constant(1234)
-        .build()
-    )
 
-    ctx = Context(params, False, SecurityLevel(128))
+def test_can_create_secret_key(bfv_context_factory):
+    ctx = bfv_context_factory(8192, (50, 30, 30, 50, 50), 1234)
     gen = KeyGenerator(ctx)
 
     secret_key = gen.secret_key()
@@ -26,36 +24,14 @@ def test_can_create_secret_key():
     assert secret_key_2.as_bytes() != secret_key.as_bytes()
 
 
-def test_can_create_public_key():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus_constant(1234)
-        .build()
-    )
-
-    ctx = Context(params, False, SecurityLevel(128))
-    gen = KeyGenerator(ctx)
+def test_can_create_public_key(shared_ctx_gen):
+    _, gen = shared_ctx_gen
 
     gen.create_public_key()
 
 
-def test_can_create_relin_key():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus_constant(1234)
-        .build()
-    )
-
-    ctx = Context(params, False, SecurityLevel(128))
-    gen = KeyGenerator(ctx)
+def test_can_create_relin_key(shared_ctx_gen):
+    _, gen = shared_ctx_gen
 
     gen.create_relinearization_key()
 
@@ -77,19 +53,8 @@ def test_can_create_galois_key():
     gen.create_galois_key()
 
 
-def test_can_init_from_existing_secret_key():
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(8192))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
-        )
-        .with_plain_modulus_constant(1234)
-        .build()
-    )
-
-    ctx = Context(params, False, SecurityLevel(128))
-    gen = KeyGenerator(ctx)
+def test_can_init_from_existing_secret_key(shared_ctx_gen):
+    ctx, gen = shared_ctx_gen
 
     secret_key = gen.secret_key()
 
@@ -1,6 +1,17 @@
+import pytest
 from sealy import (BfvEncryptionParametersBuilder,
                    CkksEncryptionParametersBuilder, CoefficientModulus,
-                   DegreeType, PlainModulus, SchemeType, SecurityLevel)
+                   DegreeType, EncryptionParameters, Modulus, PlainModulus,
+                   SchemeType, SecurityLevel)
+
+# Primes found for DegreeType(8192) with bit sizes [50, 30, 30, 50, 50].
+PRIMES_8192 = [
+    1125899905744897,
+    1073643521,
+    1073692673,
+    1125899906629633,
+    1125899906826241,
+]
 
 
 def test_can_create_plain_modulus():
@@ -8,34 +19,49 @@ def test_can_create_plain_modulus():
     assert modulus.get_value() == 1038337
 
 
-def test_can_create_default_coefficient_modulus():
-    modulus = CoefficientModulus.bfv(DegreeType(1024), SecurityLevel(128))
+@pytest.mark.parametrize(
+    "sec,expected",
+    [(128, 132120577), (192, 520193), (256, 12289)],
+    ids=["tc128", "tc192", "tc256"],
+)
+def test_can_create_default_coefficient_modulus(sec, expected):
+    modulus = CoefficientModulus.bfv(DegreeType(1024), SecurityLevel(sec))
     assert len(modulus) == 1
-    assert modulus[0].get_value() == 132120577
+    assert modulus[0].get_value() == expected
 
-    modulus = CoefficientModulus.bfv(DegreeType(1024), SecurityLevel(192))
-    assert len(modulus) == 1
-    assert modulus[0].get_value() == 520193
 
-    modulus = CoefficientModulus.bfv(DegreeType(1024), SecurityLevel(256))
-    assert len(modulus) == 1
-    assert modulus[0].get_value() == 12289
+@pytest.mark.parametrize(
+    "create",
+    [CoefficientModulus.create, CoefficientModulus.ckks],
+    ids=["create", "ckks"],
+)
+def test_can_create_custom_coefficient_modulus(create):
+    modulus = create(DegreeType(8192), [50, 30, 30, 50, 50])
+    assert [m.get_value() for m in modulus] == PRIMES_8192
+
+
+def test_repeated_modulus_creation_is_consistent():
+    for _ in range(2):
+        modulus = CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
+        assert [m.get_value() for m in modulus] == PRIMES_8192
+
+        assert PlainModulus.batching(DegreeType(1024), 20).get_value() == 1038337
+
+    assert hash(DegreeType(8192)) == hash(DegreeType(8192))
 
 
-def test_can_create_custom_coefficient_modulus():
-    modulus = CoefficientModulus.ckks(DegreeType(8192), [50, 30, 30, 50, 50])
-    assert len(modulus) == 5
-    assert modulus[0].get_value() == 1125899905744897
-    assert modulus[1].get_value() == 1073643521
-    assert modulus[2].get_value() == 1073692673
-    assert modulus[3].get_value() == 1125899906629633
-    assert modulus[4].get_value() == 1125899906826241
+def test_cached_modulus_is_not_shared_between_calls():
+    modulus = CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
+    modulus.pop()
 
+    modulus = CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
+    assert [m.get_value() for m in modulus] == PRIMES_8192
 
-def test_can_roundtrip_security_level():
-    for sec in [SecurityLevel(128), SecurityLevel(192), SecurityLevel(256)]:
-        sec_2 = SecurityLevel(sec.get_value())
-        assert sec == sec_2
+
+@pytest.mark.parametrize("value", [128, 192, 256])
+def test_can_roundtrip_security_level(value):
+    sec = SecurityLevel(value)
+    assert SecurityLevel(sec.get_value()) == sec
 
 
 def test_can_build_ckks_params():
@@ -62,11 +88,7 @@ def test_can_build_ckks_params():
     ).build()
 
     modulus = params.get_coefficient_modulus()
-    assert modulus[0].get_value() == 1125899905744897
-    assert modulus[1].get_value() == 1073643521
-    assert modulus[2].get_value() == 1073692673
-    assert modulus[3].get_value() == 1125899906629633
-    assert modulus[4].get_value() == 1125899906826241
+    assert [m.get_value() for m in modulus] == PRIMES_8192
 
 
 def test_can_build_bfv_params():
@@ -95,8 +117,106 @@ def test_can_build_bfv_params():
     ).build()
 
     modulus = params.get_coefficient_modulus()
-    assert modulus[0].get_value() == 1125899905744897
-    assert modulus[1].get_value() == 1073643521
-    assert modulus[2].get_value() == 1073692673
-    assert modulus[3].get_value() == 1125899906629633
-    assert modulus[4].get_value() == 1125899906826241
+    assert [m.get_value() for m in modulus] == PRIMES_8192
+
+
+@pytest.mark.parametrize("scheme", [SchemeType.bfv(), SchemeType.ckks()])
+def test_can_roundtrip_scheme_type(scheme):
+    assert SchemeType(scheme.get_value()) == scheme
+
+
+def test_can_roundtrip_params_bytes():
+    params = (
+        BfvEncryptionParametersBuilder()
+        .with_poly_modulus_degree(DegreeType(8192))
+        .with_coefficient_modulus(
+            CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
+        )
+        .with_plain_modulus_constant(1234)
+    ).build()
+
+    data = params.to_bytes()
+    assert isinstance(data, bytes)
+
+    loaded = EncryptionParameters.from_bytes(SchemeType.bfv(), data)
+    assert loaded.get_poly_modulus_degree() == 8192
+    assert loaded.get_plain_modulus().get_value() == 1234
+    assert [m.get_value() for m in loaded.get_coefficient_modulus()] == PRIMES_8192
+    assert loaded.to_bytes() == data
+
+
+def test_can_build_bfv_params_from_assigned_fields():
+    builder = BfvEncryptionParametersBuilder()
+    builder.poly_modulus_degree = DegreeType(1024)
+    builder.coeff_modulus = CoefficientModulus.bfv(
+        DegreeType(1024), SecurityLevel.default()
+    )
+    builder.plain_modulus = Modulus(5)
+
+    assert builder.build().get_plain_modulus().get_value() == 5
+
+    builder.plain_modulus = 1234
+    assert builder.build().get_plain_modulus().get_value() == 1234
+
+    builder.plain_modulus = "1234"
+    with pytest.raises(ValueError, match="plain_modulus must be Modulus or int"):
+        builder.build()
+
+
+def test_builders_do_not_allow_unknown_attributes():
+    with pytest.raises(AttributeError):
+        BfvEncryptionParametersBuilder().plain_modulus_bits = 20
+
+    with pytest.raises(AttributeError):
+        CkksEncryptionParametersBuilder().plain_modulus = 1234
+
+
+def test_builders_reject_invalid_values_when_set():
+    with pytest.raises(ValueError):
+        BfvEncryptionParametersBuilder().with_poly_modulus_degree(8192)
+
+    with pytest.raises(ValueError):
+        CkksEncryptionParametersBuilder().with_coefficient_modulus(None)
+
+    with pytest.raises(ValueError):
+        BfvEncryptionParametersBuilder().with_plain_modulus(None)
+
+
+def test_build_reports_the_unset_field():
+    builder = BfvEncryptionParametersBuilder().with_poly_modulus_degree(
+        DegreeType(8192)
+    )
+
+    with pytest.raises(ValueError, match="coeff_modulus cannot be None"):
+        builder.build()
+
+    builder.with_coefficient_modulus(
+        CoefficientModulus.create(DegreeType(8192), [50, 30, 30, 50, 50])
+    )
+
+    with pytest.raises(ValueError, match="plain_modulus cannot be None"):
+        builder.build()
+
+
+def test_build_rejects_assigned_values_of_the_wrong_type():
+    builder = BfvEncryptionParametersBuilder().with_poly_modulus_degree(
+        DegreeType(8192)
+    )
+    builder.coeff_modulus = [8192]
+
+    # Reported before the plain modulus, which is still unset.
+    with pytest.raises(ValueError, match="coeff_modulus must be a list of Modulus"):
+        builder.build()
+
+    builder.plain_modulus = 1234
+
+    with pytest.raises(ValueError, match="coeff_modulus must be a list of Modulus"):
+        builder.build()
+
+    builder = CkksEncryptionParametersBuilder().with_coefficient_modulus(
+        CoefficientModulus.ckks(DegreeType(8192), [60, 40, 40, 60])
+    )
+    builder.poly_modulus_degree = 8192
+
+    with pytest.raises(ValueError, match="poly_modulus_degree must be a DegreeType"):
+        builder.build()
@@ -1,39 +1,22 @@
-import os
 import pickle
-import tempfile
 
-from sealy import (BfvEncryptionParametersBuilder, CoefficientModulus, Context,
-                   DegreeType, SchemeType, SecurityLevel)
+from sealy import Context, SchemeType, SecurityLevel
 
 
-def test_pickle_context():
-    # Create encryption parameters
-    params = (
-        BfvEncryptionParametersBuilder()
-        .with_poly_modulus_degree(DegreeType(1024))
-        .with_coefficient_modulus(
-            CoefficientModulus.create(DegreeType(1024), [60, 40, 40, 60])
-        )
-        .with_plain_modulus_constant(1234)
-        .build()
-    )
+class _TracedContext(Context):
+    pass
 
-    # Create context
-    ctx = Context(params, False, SecurityLevel(128))
 
-    # create a temporary file
-    temp_file = tempfile.mktemp()
+def test_pickle_context(bfv_context_factory):
+    ctx = bfv_context_factory(1024, (60, 40, 40, 60), 1234)
 
-    # Save the context to the file
-    with open(temp_file, "wb") as f:
-        pickle.dump(ctx, f)
+    # Round-trip the context through an in-memory pickle
+    blob = pickle.dumps(ctx)
+    ctx_2: Context = pickle.loads(blob)
 
-    # Load the context from the file
-    with open(temp_file, "rb") as f:
-        ctx_2: Context = pickle.load(f)
-
-    assert len(ctx_2.get_key_parms_id()) > 0
-    assert len(ctx_2.get_last_parms_id()) > 0
+    assert len(ctx_2.key_parms_id) > 0
+    assert len(ctx_2.last_parms_id) > 0
+    assert ctx_2.key_parms_id == tuple(ctx_2.get_key_parms_id())
 
     enc_parms = ctx_2.get_encryption_parameters()
 
@@ -41,3 +24,35 @@ def test_pickle_context():
     assert enc_parms.get_scheme() == SchemeType.bfv()
     assert len(enc_parms.get_coefficient_modulus()) == 4
     assert enc_parms.get_plain_modulus().get_value() == 1234
+
+
+def test_unpickled_context_reuses_live_instance(bfv_context_factory):
+    ctx = bfv_context_factory(1024, (60, 40, 40, 60), 1234)
+
+    # While the original is alive, loading skips the context pre-computations
+    assert pickle.loads(pickle.dumps(ctx)) is ctx
+
+
+def test_pickle_preserves_context_subclass(bfv_context_factory):
+    params = bfv_context_factory(
+        1024, (60, 40, 40, 60), 1234
+    ).get_encryption_parameters()
+    ctx = _TracedContext(params, False, SecurityLevel(128))
+
+    ctx_2 = pickle.loads(pickle.dumps(ctx))
+
+    assert type(ctx_2) is _TracedContext
+    assert ctx_2 is ctx
+
+
+def test_context_bytes_round_trip(ckks_context):
+    blob = ckks_context.dumps()
+    ctx = Context.loads(blob)
+
+    assert ctx is ckks_context
+    assert ctx.dumps() == blob
+
+    enc_parms = ctx.get_encryption_parameters()
+
+    assert enc_parms.get_scheme() == SchemeType.ckks()
+    assert enc_parms.get_poly_modulus_degree() == 8192
@@ -1,3 +1,4 @@
+import pytest
 from sealy import Plaintext
 
 
@@ -12,3 +13,8 @@ def test_plaintext_coefficients_in_increasing_order():
     assert plaintext.get_coefficient(0) == 0x4321
     assert plaintext.get_coefficient(1) == 0
     assert plaintext.get_coefficient(2) == 0x1234
+
+
+def test_from_hex_string_rejects_null_characters():
+    with pytest.raises(ValueError):
+        Plaintext.from_hex_string("1234x^2\0 + 4321")
@@ -1,7 +1,8 @@
-from sealy import (BfvEncryptionParametersBuilder, Ciphertext,
-                   CoefficientModulus, Context, DegreeType, PolynomialArray,
-                   SecurityLevel)
-from sealy.sealy import BFVEncoder, Encryptor, KeyGenerator, PlainModulus
+import numpy as np
+import pytest
+from sealy import (BFVEncoder, BfvEncryptionParametersBuilder, Ciphertext,
+                   CoefficientModulus, Context, DegreeType, Encryptor,
+                   KeyGenerator, PlainModulus, PolynomialArray, SecurityLevel)
 
 
 def test_can_create_and_destroy_static_polynomial_array():
@@ -32,7 +33,9 @@ def test_polynomial_array_initially_not_reserved():
     assert not poly_array.is_reserved()
 
 
-def generate_ciphertext_example():
+# Both tests below only read the example, so it is generated once per module.
+@pytest.fixture(scope="module")
+def ciphertext_example():
     coeff_modulus = CoefficientModulus.create(
         DegreeType(8192), [50, 30, 30, 50, 50]
     )
@@ -49,7 +52,7 @@ def generate_ciphertext_example():
 
     encoder = BFVEncoder(ctx)
 
-    data = [i for i in range(encoder.get_slot_count())]
+    data = np.arange(encoder.get_slot_count(), dtype=np.int64).tolist()
 
     plaintext = encoder.encode_int(data)
 
@@ -71,12 +74,13 @@ def generate_ciphertext_example():
     )
 
 
-def test_correct_poly_array_sizes_from_ciphertext():
-    ctx, _, public_key, ciphertext, u, e, r = generate_ciphertext_example()
+def test_correct_poly_array_sizes_from_ciphertext(ciphertext_example):
+    ctx, _, public_key, ciphertext, u, e, r = ciphertext_example
     poly_array_public_key = PolynomialArray.from_public_key(ctx, public_key)
     poly_array_ciphertext = PolynomialArray.from_ciphertext(ctx, ciphertext)
 
     poly_array_ciphertext_encoded = poly_array_ciphertext.as_ints()
+    assert poly_array_ciphertext_encoded.dtype == np.uint64
     poly_array_public_key_encoded = poly_array_public_key.as_ints()
     u_encoded = u.as_ints()
     e_encoded = e.as_ints()
@@ -87,62 +91,30 @@ def test_correct_poly_array_sizes_from_ciphertext():
     assert e.is_reserved()
 
     # Ciphertext size checks
-    assert (
-        poly_array_ciphertext.get_num_polynomials()
-        == ciphertext.get_num_polynomials()
-    )
-    assert poly_array_ciphertext.get_poly_modulus_degree() == 8192
-    assert (
-        poly_array_ciphertext.get_coeff_modulus_size()
-        == ciphertext.get_coeff_modulus_size()
-    )
-
-    assert (
-        len(poly_array_ciphertext_encoded)
-        == poly_array_ciphertext.get_num_polynomials()
-        * poly_array_ciphertext.get_poly_modulus_degree()
-        * poly_array_ciphertext.get_coeff_modulus_size()
-    )
+    ct_polys, ct_moduli = ciphertext.shape()
+    n_polys, degree, n_moduli = poly_array_ciphertext.shape()
+    assert (n_polys, degree, n_moduli) == (ct_polys, 8192, ct_moduli)
+    assert len(poly_array_ciphertext_encoded) == n_polys * degree * n_moduli
 
     # Public key
-    assert poly_array_public_key.get_num_polynomials() == 2
-    assert poly_array_public_key.get_poly_modulus_degree() == 8192
-    assert poly_array_public_key.get_coeff_modulus_size() == 4
-
-    assert (
-        len(poly_array_public_key_encoded)
-        == poly_array_public_key.get_num_polynomials()
-        * poly_array_public_key.get_poly_modulus_degree()
-        * poly_array_public_key.get_coeff_modulus_size()
-    )
+    n_polys, degree, n_moduli = poly_array_public_key.shape()
+    assert (n_polys, degree, n_moduli) == (2, 8192, 4)
+    assert len(poly_array_public_key_encoded) == n_polys * degree * n_moduli
 
     # u
-    assert u.get_num_polynomials() == 1
-    assert u.get_poly_modulus_degree() == 8192
-    assert u.get_coeff_modulus_size() == 4
-    assert (
-        len(u_encoded)
-        == poly_array_public_key.get_poly_modulus_degree()
-        * poly_array_ciphertext.get_coeff_modulus_size()
-    )
+    assert u.shape() == (1, 8192, 4)
+    assert len(u_encoded) == 8192 * ct_moduli
 
     # e
-    assert e.get_num_polynomials() == 2
-    assert e.get_poly_modulus_degree() == 8192
-    assert e.get_coeff_modulus_size() == 4
-    assert (
-        len(e_encoded)
-        == ciphertext.get_num_polynomials()
-        * poly_array_public_key.get_poly_modulus_degree()
-        * ciphertext.get_coeff_modulus_size()
-    )
+    assert e.shape() == (2, 8192, 4)
+    assert len(e_encoded) == ct_polys * 8192 * ct_moduli
 
     # r
     assert r.size() == 8192
 
 
-def test_multiprecision_and_back_is_identity():
-    ctx, _, _, ciphertext, _, _, _ = generate_ciphertext_example()
+def test_multiprecision_and_back_is_identity(ciphertext_example):
+    ctx, _, _, ciphertext, _, _, _ = ciphertext_example
     poly_array = PolynomialArray.from_ciphertext(ctx, ciphertext)
 
     poly_array_encoded_original = poly_array.as_ints()
@@ -152,4 +124,6 @@ def test_multiprecision_and_back_is_identity():
 
     poly_array_encoded_round_trip = poly_array.as_ints()
 
-    assert poly_array_encoded_original == poly_array_encoded_round_trip
+    np.testing.assert_array_equal(
+        poly_array_encoded_original, poly_array_encoded_round_trip
+    )
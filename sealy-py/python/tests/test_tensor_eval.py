@@ -1,58 +1,37 @@
-import random
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 
+import numpy as np
 import pytest
-from sealy import (CiphertextTensor, CkksEncryptionParametersBuilder,
-                   CKKSTensorEncoder, CKKSTensorEvaluator, CoefficientModulus,
-                   Context, DegreeType, KeyGenerator, SecurityLevel,
+from sealy import (CiphertextTensor, CKKSEncoder, CKKSTensorEncoder,
+                   CKKSTensorEvaluator, Context, KeyGenerator,
                    TensorDecryptor, TensorEncryptor)
 
 
+_rng = np.random.default_rng(0)
+
+
 def generate_random_tensor(size):
-    return [random.uniform(0.0, 1.0) for _ in range(size)]
+    return _rng.random(size)
 
 
 def average_ciphertexts(
     ctx: Context,
     encoder: CKKSTensorEncoder,
     ciphertexts: List[CiphertextTensor],
-    size: int,
 ):
     evaluator = CKKSTensorEvaluator(ctx)
 
-    cipher = evaluator.add_many(ciphertexts)
-
-    fraction = 1.0 / len(ciphertexts)
-    fraction = [fraction] * size
-    fraction = encoder.encode_float(fraction)
-
-    return evaluator.multiply_plain(cipher, fraction)
+    return evaluator.mean(ciphertexts, encoder)
 
 
 def average_plaintexts(plaintexts):
-    avg = [0.0] * len(plaintexts[0])
-    for tensor in plaintexts:
-        for i, val in enumerate(tensor):
-            avg[i] += val
-    return [val / len(plaintexts) for val in avg]
+    return np.mean(np.asarray(plaintexts, dtype=np.float64), axis=0)
 
 
 @pytest.fixture
-def context() -> Context:
-    degree = DegreeType(8192)
-    security_level = SecurityLevel(128)
-    bit_sizes = [60, 40, 40, 60]
-
-    expand_mod_chain = False
-    modulus_chain = CoefficientModulus.create(degree, bit_sizes)
-    encryption_parameters = (
-        CkksEncryptionParametersBuilder()
-        .with_poly_modulus_degree(degree)
-        .with_coefficient_modulus(modulus_chain)
-        .build()
-    )
-
-    return Context(encryption_parameters, expand_mod_chain, security_level)
+def context(ckks_context: Context) -> Context:
+    return ckks_context
 
 
 @pytest.fixture
@@ -87,20 +66,16 @@ def test_average_ciphertexts(
     client_2_gradients = generate_random_tensor(11000)
     client_3_gradients = generate_random_tensor(11000)
 
-    client_1_encoded_gradients = encoder.encode_float(client_1_gradients)
-    client_2_encoded_gradients = encoder.encode_float(client_2_gradients)
-    client_3_encoded_gradients = encoder.encode_float(client_3_gradients)
-
-    client_1_encrypted_gradients = encryptor.encrypt(
-        client_1_encoded_gradients
-    )
-    client_2_encrypted_gradients = encryptor.encrypt(
-        client_2_encoded_gradients
-    )
-    client_3_encrypted_gradients = encryptor.encrypt(
-        client_3_encoded_gradients
+    encoded_gradients = encoder.encode_batch(
+        [client_1_gradients, client_2_gradients, client_3_gradients]
     )
 
+    (
+        client_1_encrypted_gradients,
+        client_2_encrypted_gradients,
+        client_3_encrypted_gradients,
+    ) = encryptor.encrypt_many(encoded_gradients)
+
     avg_truth = average_plaintexts(
         [client_1_gradients, client_2_gradients, client_3_gradients]
     )
@@ -113,13 +88,120 @@ def test_average_ciphertexts(
             client_2_encrypted_gradients,
             client_3_encrypted_gradients,
         ],
-        10,
     )
 
     avg_dec = decryptor.decrypt(avg)
     avg_plain = encoder.decode_float(avg_dec)
 
-    avg_plain = avg_plain[:10]
+    np.testing.assert_allclose(avg_plain[:11000], avg_truth, atol=1e-6)
+
+
+def test_mean_over_rounds(
+    context: Context,
+    encoder: CKKSTensorEncoder,
+    encryptor: TensorEncryptor,
+    decryptor: TensorDecryptor,
+):
+    evaluator = CKKSTensorEvaluator(context)
+
+    # The 1/n plaintext is cached per encoder; alternate n to exercise both
+    # the cached and the freshly encoded paths.
+    for n in [3, 2, 3]:
+        gradients = [generate_random_tensor(5000) for _ in range(n)]
+        ciphertexts = [
+            encryptor.encrypt(encoder.encode_float_buffer(g)) for g in gradients
+        ]
+
+        avg = evaluator.mean(ciphertexts, encoder)
+        avg_plain = encoder.decode_float(decryptor.decrypt(avg))
+
+        np.testing.assert_allclose(
+            avg_plain[:5000], average_plaintexts(gradients), atol=1e-6
+        )
+
+
+def test_add_many_multiply_plain(
+    context: Context,
+    encoder: CKKSTensorEncoder,
+    encryptor: TensorEncryptor,
+    decryptor: TensorDecryptor,
+):
+    evaluator = CKKSTensorEvaluator(context)
+    scalar_encoder = CKKSEncoder(context, 2**40)
+
+    gradients = [generate_random_tensor(11000) for _ in range(3)]
+    ciphertexts = [
+        encryptor.encrypt(encoder.encode_float(g.tolist())) for g in gradients
+    ]
+    half = scalar_encoder.encode_scalar(0.5)
+
+    result = evaluator.add_many_multiply_plain(ciphertexts, half)
+    result_plain = encoder.decode_float(decryptor.decrypt(result))
+
+    np.testing.assert_allclose(
+        result_plain[:11000], np.sum(gradients, axis=0) * 0.5, atol=1e-6
+    )
+
+
+def test_add_many_into_reuses_accumulator(
+    context: Context,
+    encoder: CKKSTensorEncoder,
+    encryptor: TensorEncryptor,
+    decryptor: TensorDecryptor,
+):
+    evaluator = CKKSTensorEvaluator(context)
+    acc = CiphertextTensor([])
+
+    for n in [3, 2]:
+        gradients = [generate_random_tensor(11000) for _ in range(n)]
+        ciphertexts = encryptor.encrypt_many(
+            [encoder.encode_float_buffer(g) for g in gradients]
+        )
+
+        evaluator.add_many_into(ciphertexts, acc)
+        acc_plain = encoder.decode_float(decryptor.decrypt(acc))
+
+        np.testing.assert_allclose(
+            acc_plain[:11000], np.sum(gradients, axis=0), atol=1e-6
+        )
+
+
+def test_clients_can_be_processed_concurrently(
+    context: Context,
+    encoder: CKKSTensorEncoder,
+    encryptor: TensorEncryptor,
+    decryptor: TensorDecryptor,
+):
+    evaluator = CKKSTensorEvaluator(context)
+    gradients = [generate_random_tensor(11000) for _ in range(8)]
+
+    # The encoder, encryptor and evaluator are shared by every worker.
+    def process(g):
+        ciphertext = encryptor.encrypt(encoder.encode_float_buffer(g))
+        return evaluator.add(ciphertext, ciphertext)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        ciphertexts = list(executor.map(process, gradients))
+
+    avg = evaluator.mean(ciphertexts, encoder)
+    avg_plain = encoder.decode_float(decryptor.decrypt(avg))
+
+    np.testing.assert_allclose(
+        avg_plain[:11000], average_plaintexts(gradients) * 2, atol=1e-6
+    )
+
+
+def test_ciphertext_tensor_as_array(
+    encoder: CKKSTensorEncoder,
+    encryptor: TensorEncryptor,
+):
+    plaintext = encoder.encode_float_buffer(generate_random_tensor(5000))
+    tensor = encryptor.encrypt(plaintext)
+
+    coefficients = np.asarray(tensor)
 
-    for t, p in zip(avg_truth, avg_plain):
-        assert abs(t - p) < 1e-6
+    assert coefficients.dtype == np.uint64
+    # Two chunks of 4096 slots, each a fresh ciphertext with two polynomials
+    # over the three data primes of an 8192-degree [60, 40, 40, 60] modulus.
+    assert coefficients.shape == (2, 2, 3, 8192)
+    assert coefficients.any()
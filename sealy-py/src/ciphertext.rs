@@ -63,6 +63,15 @@ impl PyCiphertext {
 		self.inner.coeff_modulus_size()
 	}
 
+	/// Returns the number of polynomials and the number of components in the
+	/// coefficient modulus as a single tuple.
+	pub fn shape(&self) -> (u64, u64) {
+		(
+			self.inner.num_polynomials(),
+			self.inner.coeff_modulus_size(),
+		)
+	}
+
 	/// Returns the coefficient in the form the ciphertext is currently in (NTT
 	/// form or not). For BFV, this will be the coefficient in the residual
 	/// number system (RNS) format.
@@ -8,7 +8,7 @@ use crate::{PyEncryptionParameters, PySecurityLevel};
 /// is constructed from a given set of encryption parameters. It validates the parameters
 /// for correctness, evaluates their properties, and performs and stores the results of
 /// several costly pre-computations.
-#[pyclass(module = "sealy", name = "Context")]
+#[pyclass(module = "sealy", name = "Context", subclass)]
 pub struct PyContext {
 	pub(crate) inner: sealy::Context,
 }
@@ -35,14 +35,17 @@ impl PyDecryptor {
 	///  * `encrypted` - The ciphertext to decrypt.
 	pub fn decrypt(
 		&self,
+		py: Python<'_>,
 		ciphertext: &PyCiphertext,
 	) -> PyResult<PyPlaintext> {
-		let decrypted = self.inner.decrypt(&ciphertext.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to decrypt ciphertext: {:?}",
-				e
-			))
-		})?;
+		let decrypted = py
+			.allow_threads(|| self.inner.decrypt(&ciphertext.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to decrypt ciphertext: {:?}",
+					e
+				))
+			})?;
 		Ok(PyPlaintext {
 			inner: decrypted,
 		})
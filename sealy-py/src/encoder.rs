@@ -1,3 +1,4 @@
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
 
 use crate::{context::PyContext, plaintext::PyPlaintext};
@@ -33,14 +34,40 @@ impl PyBFVEncoder {
 	/// Encodes the given data into a plaintext.
 	pub fn encode_int(
 		&self,
+		py: Python<'_>,
 		data: Vec<i64>,
 	) -> PyResult<PyPlaintext> {
-		let encoded = self.inner.encode_i64(&data).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to encode data: {:?}",
-				e
-			))
-		})?;
+		let encoded = py
+			.allow_threads(|| self.inner.encode_i64(&data))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encode data: {:?}",
+					e
+				))
+			})?;
+		Ok(PyPlaintext {
+			inner: encoded,
+		})
+	}
+
+	/// Encodes the given buffer of 64-bit signed integers (e.g. a NumPy `int64`
+	/// array) into a plaintext without converting each element to a Python object.
+	pub fn encode_int_buffer(
+		&self,
+		py: Python<'_>,
+		data: PyBuffer<i64>,
+	) -> PyResult<PyPlaintext> {
+		// Copied while the GIL is held, so no Python thread can write to the
+		// buffer while it is being encoded.
+		let data = data.to_vec(py)?;
+		let encoded = py
+			.allow_threads(|| self.inner.encode_i64(&data))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encode data: {:?}",
+					e
+				))
+			})?;
 		Ok(PyPlaintext {
 			inner: encoded,
 		})
@@ -63,15 +90,18 @@ impl PyBFVEncoder {
 	/// Encodes the given data into a plaintext.
 	pub fn encode_float(
 		&self,
+		py: Python<'_>,
 		data: Vec<f64>,
 		base: f64,
 	) -> PyResult<PyPlaintext> {
-		let encoded = self.inner.encode_f64(&data, base).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to encode data: {:?}",
-				e
-			))
-		})?;
+		let encoded = py
+			.allow_threads(|| self.inner.encode_f64(&data, base))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encode data: {:?}",
+					e
+				))
+			})?;
 		Ok(PyPlaintext {
 			inner: encoded,
 		})
@@ -133,14 +163,60 @@ impl PyCKKSEncoder {
 	/// Encodes the given data into a plaintext.
 	pub fn encode_float(
 		&self,
+		py: Python<'_>,
 		data: Vec<f64>,
 	) -> PyResult<PyPlaintext> {
-		let encoded = self.inner.encode_f64(&data).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to encode data: {:?}",
-				e
-			))
-		})?;
+		let encoded = py
+			.allow_threads(|| self.inner.encode_f64(&data))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encode data: {:?}",
+					e
+				))
+			})?;
+		Ok(PyPlaintext {
+			inner: encoded,
+		})
+	}
+
+	/// Encodes the given value into every slot of a plaintext. This is much
+	/// cheaper than encoding a list holding the same value in every slot.
+	pub fn encode_scalar(
+		&self,
+		py: Python<'_>,
+		value: f64,
+	) -> PyResult<PyPlaintext> {
+		let encoded = py
+			.allow_threads(|| self.inner.encode_scalar_f64(value))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encode scalar: {:?}",
+					e
+				))
+			})?;
+		Ok(PyPlaintext {
+			inner: encoded,
+		})
+	}
+
+	/// Encodes the given buffer of 64-bit floats (e.g. a NumPy `float64` array)
+	/// into a plaintext without converting each element to a Python object.
+	pub fn encode_float_buffer(
+		&self,
+		py: Python<'_>,
+		data: PyBuffer<f64>,
+	) -> PyResult<PyPlaintext> {
+		// Copied while the GIL is held, so no Python thread can write to the
+		// buffer while it is being encoded.
+		let data = data.to_vec(py)?;
+		let encoded = py
+			.allow_threads(|| self.inner.encode_f64(&data))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encode data: {:?}",
+					e
+				))
+			})?;
 		Ok(PyPlaintext {
 			inner: encoded,
 		})
@@ -1,4 +1,5 @@
 use pyo3::prelude::*;
+use rayon::prelude::*;
 
 use crate::{
 	ciphertext::PyCiphertext, context::PyContext, keys::PyPublicKey, plaintext::PyPlaintext,
@@ -83,28 +84,64 @@ impl PyEncryptor {
 	/// a serializable object.
 	pub fn encrypt(
 		&self,
+		py: Python<'_>,
 		plaintext: &PyPlaintext,
 	) -> PyResult<PyCiphertext> {
-		let ciphertext = self.inner.encrypt(&plaintext.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to encrypt plaintext: {:?}",
-				e
-			))
-		})?;
+		let plaintext = &plaintext.inner;
+		let ciphertext = py
+			.allow_threads(|| self.inner.encrypt(plaintext))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encrypt plaintext: {:?}",
+					e
+				))
+			})?;
 		Ok(PyCiphertext {
 			inner: ciphertext,
 		})
 	}
 
+	/// Encrypts a list of plaintexts with the public key. The GIL is released
+	/// once for the whole batch and the plaintexts are encrypted in parallel.
+	pub fn encrypt_many(
+		&self,
+		py: Python<'_>,
+		plaintexts: Vec<PyRef<PyPlaintext>>,
+	) -> PyResult<Vec<PyCiphertext>> {
+		let encryptor = &self.inner;
+		let plaintexts: Vec<&sealy::Plaintext> = plaintexts.iter().map(|p| &p.inner).collect();
+
+		let ciphertexts = py
+			.allow_threads(|| {
+				plaintexts
+					.par_iter()
+					.map(|p| encryptor.encrypt(p))
+					.collect::<sealy::Result<Vec<_>>>()
+			})
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encrypt plaintexts: {:?}",
+					e
+				))
+			})?;
+
+		Ok(ciphertexts
+			.into_iter()
+			.map(|c| PyCiphertext {
+				inner: c,
+			})
+			.collect())
+	}
+
 	/// Encrypts a plaintext with the public key and returns the ciphertext
 	/// and the components used in the encryption.
 	pub fn encrypt_return_components(
 		&self,
+		py: Python<'_>,
 		plaintext: &PyPlaintext,
 	) -> PyResult<(PyCiphertext, PyAsymmetricComponents)> {
-		let (ciphertext, components) = self
-			.inner
-			.encrypt_return_components(&plaintext.inner)
+		let (ciphertext, components) = py
+			.allow_threads(|| self.inner.encrypt_return_components(&plaintext.inner))
 			.map_err(|e| {
 				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
 					"Failed to encrypt plaintext and return components: {:?}",
@@ -70,5 +70,8 @@ fn sealy(m: &Bound<'_, PyModule>) -> PyResult<()> {
 	m.add_class::<PyTensorEncryptor>()?;
 	m.add_class::<PyTensorDecryptor>()?;
 
+	// Whether SEAL was built against Intel HEXL (the `hexl` feature).
+	m.add("HEXL_ENABLED", cfg!(feature = "hexl"))?;
+
 	Ok(())
 }
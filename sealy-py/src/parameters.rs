@@ -1,6 +1,40 @@
+use std::collections::HashMap;
+use std::hash::Hash;
+use std::sync::{Mutex, OnceLock};
+
 use pyo3::prelude::*;
+use pyo3::types::PyBytes;
 use sealy::{FromBytes, ToBytes};
 
+/// Primes found by `CoefficientModulus.create`, keyed by `(degree, bit_sizes)`.
+/// Finding NTT-friendly primes is a pure function of its arguments, so it only
+/// needs to run once per key. Only the prime values are stored: fresh `Modulus`
+/// objects are built on every call, so no SEAL handle is shared between callers.
+static COEFF_MODULUS_CACHE: OnceLock<Mutex<HashMap<(u64, Vec<i32>), Vec<u64>>>> = OnceLock::new();
+
+/// Primes found by `PlainModulus.batching`, keyed by `(degree, bit_size)`.
+static PLAIN_MODULUS_CACHE: OnceLock<Mutex<HashMap<(u64, u32), u64>>> = OnceLock::new();
+
+/// Maximum number of keys kept by each of the modulus caches, so that long
+/// parameter sweeps do not grow them without bound.
+const MODULUS_CACHE_CAPACITY: usize = 64;
+
+/// Inserts into one of the modulus caches, evicting an arbitrary entry when it
+/// is full. Evicted primes are simply searched for again on their next use.
+fn insert_bounded<K: Clone + Eq + Hash, V>(
+	cache: &mut HashMap<K, V>,
+	key: K,
+	value: V,
+) {
+	if cache.len() >= MODULUS_CACHE_CAPACITY && !cache.contains_key(&key) {
+		if let Some(evicted) = cache.keys().next().cloned() {
+			cache.remove(&evicted);
+		}
+	}
+
+	cache.insert(key, value);
+}
+
 #[pyclass(module = "sealy", name = "SchemeType")]
 #[derive(Debug, Clone)]
 pub struct PySchemeType {
@@ -30,6 +64,11 @@ impl PySchemeType {
 		}
 	}
 
+	/// Returns the numeric value of the scheme type.
+	pub fn get_value(&self) -> u8 {
+		self.inner.to_u8()
+	}
+
 	fn __str__(&self) -> String {
 		format!("{:?}", self.inner)
 	}
@@ -159,6 +198,37 @@ impl PyEncryptionParameters {
 		})
 	}
 
+	/// Serializes the encryption parameters into bytes.
+	pub fn to_bytes<'py>(
+		&self,
+		py: Python<'py>,
+	) -> PyResult<Bound<'py, PyBytes>> {
+		let bytes = self.inner.as_bytes().map_err(|e| {
+			PyErr::new::<pyo3::exceptions::PyException, _>(format!(
+				"Error serializing EncryptionParameters: {}",
+				e
+			))
+		})?;
+		Ok(PyBytes::new_bound(py, &bytes))
+	}
+
+	/// Deserializes encryption parameters of the given scheme from bytes.
+	#[staticmethod]
+	pub fn from_bytes(
+		scheme: PySchemeType,
+		data: &[u8],
+	) -> PyResult<Self> {
+		let params = sealy::EncryptionParameters::from_bytes(&scheme.inner, data).map_err(|e| {
+			PyErr::new::<pyo3::exceptions::PyException, _>(format!(
+				"Error deserializing EncryptionParameters: {}",
+				e
+			))
+		})?;
+		Ok(Self {
+			inner: params,
+		})
+	}
+
 	fn __str__(&self) -> String {
 		format!("{:?}", self.inner)
 	}
@@ -206,19 +276,27 @@ impl PyCoefficientModulus {
 		degree: PyDegreeType,
 		bit_sizes: Vec<i32>,
 	) -> PyResult<Vec<PyModulus>> {
-		let modulus =
-			sealy::CoefficientModulusFactory::build(degree.inner, &bit_sizes).map_err(|e| {
-				PyErr::new::<pyo3::exceptions::PyException, _>(format!(
-					"Error creating CoefficientModulus: {}",
-					e
-				))
-			})?;
-		Ok(modulus
-			.into_iter()
-			.map(|m| PyModulus {
-				inner: m,
-			})
-			.collect())
+		let cache = COEFF_MODULUS_CACHE.get_or_init(Default::default);
+		let key = (u64::from(degree.inner), bit_sizes);
+
+		let cached = cache.lock().unwrap().get(&key).cloned();
+		let values = match cached {
+			Some(values) => values,
+			None => {
+				let modulus = sealy::CoefficientModulusFactory::build(degree.inner, &key.1)
+					.map_err(|e| {
+						PyErr::new::<pyo3::exceptions::PyException, _>(format!(
+							"Error creating CoefficientModulus: {}",
+							e
+						))
+					})?;
+				let values: Vec<u64> = modulus.iter().map(|m| m.value()).collect();
+				insert_bounded(&mut cache.lock().unwrap(), key, values.clone());
+				values
+			}
+		};
+
+		values.into_iter().map(PyModulus::new).collect()
 	}
 
 	#[staticmethod]
@@ -268,6 +346,13 @@ impl PyPlainModulus {
 		degree: PyDegreeType,
 		bit_size: u32,
 	) -> PyResult<PyModulus> {
+		let cache = PLAIN_MODULUS_CACHE.get_or_init(Default::default);
+		let key = (u64::from(degree.inner), bit_size);
+
+		if let Some(&value) = cache.lock().unwrap().get(&key) {
+			return PyModulus::new(value);
+		}
+
 		let modulus =
 			sealy::PlainModulusFactory::batching(degree.inner, bit_size).map_err(|e| {
 				PyErr::new::<pyo3::exceptions::PyException, _>(format!(
@@ -275,6 +360,8 @@ impl PyPlainModulus {
 					e
 				))
 			})?;
+		insert_bounded(&mut cache.lock().unwrap(), key, modulus.value());
+
 		Ok(PyModulus {
 			inner: modulus,
 		})
@@ -366,6 +453,10 @@ impl PyDegreeType {
 	) -> bool {
 		self.inner == other.inner
 	}
+
+	fn __hash__(&self) -> u64 {
+		self.inner.into()
+	}
 }
 
 #[pyclass(module = "sealy", name = "SecurityLevel")]
@@ -71,15 +71,27 @@ impl PyPlaintext {
 	}
 
 	/// Constructs a plaintext from a given hexadecimal string describing the
-	/// plaintext polynomial.
+	/// plaintext polynomial. The string is parsed natively by SEAL, with the
+	/// GIL released.
 	#[staticmethod]
-	pub fn from_hex_string(hex_str: &str) -> PyResult<Self> {
-		let plaintext = sealy::Plaintext::from_hex_string(hex_str).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to create plaintext with hex string: {:?}",
-				e
-			))
-		})?;
+	pub fn from_hex_string(
+		py: Python<'_>,
+		hex_str: &str,
+	) -> PyResult<Self> {
+		if hex_str.contains('\0') {
+			return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+				"Hex string must not contain null characters",
+			));
+		}
+
+		let plaintext = py
+			.allow_threads(|| sealy::Plaintext::from_hex_string(hex_str))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to create plaintext with hex string: {:?}",
+					e
+				))
+			})?;
 		Ok(Self {
 			inner: plaintext,
 		})
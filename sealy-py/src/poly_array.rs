@@ -1,3 +1,4 @@
+use numpy::PyArray1;
 use pyo3::prelude::*;
 
 use crate::{
@@ -145,15 +146,20 @@ impl PyPolynomialArray {
 		Ok(data)
 	}
 
-	/// Returns the polynomial array as a vector of integers.
-	pub fn as_ints(&self) -> PyResult<Vec<u64>> {
+	/// Returns the polynomial array as a NumPy `uint64` array. The array takes
+	/// ownership of the buffer copied out of SEAL, so no Python integers are
+	/// created.
+	pub fn as_ints<'py>(
+		&self,
+		py: Python<'py>,
+	) -> PyResult<Bound<'py, PyArray1<u64>>> {
 		let data = self.inner.as_u64s().map_err(|e| {
 			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
 				"Failed to get polynomial array as ints: {:?}",
 				e
 			))
 		})?;
-		Ok(data)
+		Ok(PyArray1::from_vec_bound(py, data))
 	}
 
 	/// Returns the number of polynomials stored in the `PolynomialArray`.
@@ -171,6 +177,17 @@ impl PyPolynomialArray {
 		self.inner.coeff_modulus_size()
 	}
 
+	/// Returns the number of polynomials, the number of coefficients in each
+	/// polynomial and the number of moduli in the coefficient modulus set as a
+	/// single tuple.
+	pub fn shape(&self) -> (u64, u64, u64) {
+		(
+			self.inner.num_polynomials(),
+			self.inner.poly_modulus_degree(),
+			self.inner.coeff_modulus_size(),
+		)
+	}
+
 	/// Reduces the polynomial array by dropping the last modulus in the modulus
 	/// set.
 	pub fn drop_modulus(&self) -> PyResult<Self> {
@@ -5,7 +5,13 @@ use crate::{
 	plaintext::PyPlaintext,
 	PyCKKSEvaluator,
 };
+use std::collections::HashMap;
+use std::sync::{Arc, Mutex};
+
+use numpy::{PyArray1, PyArrayMethods};
+use pyo3::buffer::PyBuffer;
 use pyo3::prelude::*;
+use rayon::prelude::*;
 use sealy::{Evaluator, FromChunk, ToChunk};
 
 #[derive(Debug, Clone)]
@@ -54,6 +60,71 @@ impl PyCiphertextTensor {
 		Ok(bytes)
 	}
 
+	/// Returns the coefficients of every ciphertext as a NumPy `uint64` array of
+	/// shape `(chunks, polynomials, coeff_modulus_size, poly_modulus_degree)`.
+	///
+	/// SEAL does not expose the memory behind a ciphertext, so this is always a
+	/// copy: writing to the array never changes the ciphertexts. The copy is
+	/// made one coefficient at a time (see `Ciphertext::as_u64s`), so it costs
+	/// far more than the size of the array suggests.
+	#[pyo3(signature = (dtype=None, copy=None))]
+	fn __array__<'py>(
+		&self,
+		py: Python<'py>,
+		dtype: Option<Bound<'py, PyAny>>,
+		copy: Option<bool>,
+	) -> PyResult<Bound<'py, PyAny>> {
+		if copy == Some(false) {
+			return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+				"A CiphertextTensor cannot be viewed as an array without a copy",
+			));
+		}
+
+		let shape = match self.inner.first() {
+			Some(c) => [
+				self.inner.len(),
+				c.num_polynomials() as usize,
+				c.coeff_modulus_size() as usize,
+				c.poly_modulus_degree() as usize,
+			],
+			None => [0; 4],
+		};
+
+		if self.inner.iter().any(|c| {
+			[
+				c.num_polynomials() as usize,
+				c.coeff_modulus_size() as usize,
+				c.poly_modulus_degree() as usize,
+			] != shape[1..]
+		}) {
+			return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+				"The ciphertexts in the tensor do not all have the same shape",
+			));
+		}
+
+		let chunks = py
+			.allow_threads(|| {
+				self.inner
+					.0
+					.par_iter()
+					.map(|c| c.as_u64s())
+					.collect::<sealy::Result<Vec<_>>>()
+			})
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to get ciphertext batch as ints: {:?}",
+					e
+				))
+			})?;
+
+		let array = PyArray1::from_vec_bound(py, chunks.concat()).reshape(shape)?;
+
+		match dtype {
+			Some(dtype) => array.call_method1("astype", (dtype,)),
+			None => Ok(array.into_any()),
+		}
+	}
+
 	/// Creates a new ciphertext batch array from a list of byte arrays.
 	#[staticmethod]
 	pub fn from_bytes_chunk(
@@ -103,18 +174,54 @@ impl PyTensorEncryptor {
 	/// a serializable object.
 	pub fn encrypt(
 		&self,
+		py: Python<'_>,
 		plaintext: PyPlaintextTensor,
 	) -> PyResult<PyCiphertextTensor> {
-		let ciphertext = self.inner.encrypt(&plaintext.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to encrypt batch: {:?}",
-				e
-			))
-		})?;
+		let ciphertext = py
+			.allow_threads(|| self.inner.encrypt(&plaintext.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encrypt batch: {:?}",
+					e
+				))
+			})?;
 		Ok(PyCiphertextTensor {
 			inner: ciphertext,
 		})
 	}
+
+	/// Encrypts a list of plaintext tensors with the public key. The GIL is
+	/// released once for the whole list and the tensors are encrypted in parallel.
+	pub fn encrypt_many(
+		&self,
+		py: Python<'_>,
+		plaintexts: Vec<PyRef<PyPlaintextTensor>>,
+	) -> PyResult<Vec<PyCiphertextTensor>> {
+		let encryptor = &self.inner;
+		let plaintexts: Vec<&sealy::Tensor<sealy::Plaintext>> =
+			plaintexts.iter().map(|p| &p.inner).collect();
+
+		let ciphertexts = py
+			.allow_threads(|| {
+				plaintexts
+					.par_iter()
+					.map(|p| encryptor.encrypt(p))
+					.collect::<sealy::Result<Vec<_>>>()
+			})
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encrypt batches: {:?}",
+					e
+				))
+			})?;
+
+		Ok(ciphertexts
+			.into_iter()
+			.map(|c| PyCiphertextTensor {
+				inner: c,
+			})
+			.collect())
+	}
 }
 
 /// Decrypts batches of ciphertexts.
@@ -145,14 +252,17 @@ impl PyTensorDecryptor {
 	/// Decrypts a ciphertext and returns the plaintext.
 	pub fn decrypt(
 		&self,
+		py: Python<'_>,
 		ciphertext_batch: &PyCiphertextTensor,
 	) -> PyResult<PyPlaintextTensor> {
-		let plaintext = self.inner.decrypt(&ciphertext_batch.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to decrypt batch: {:?}",
-				e
-			))
-		})?;
+		let plaintext = py
+			.allow_threads(|| self.inner.decrypt(&ciphertext_batch.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to decrypt batch: {:?}",
+					e
+				))
+			})?;
 		Ok(PyPlaintextTensor {
 			inner: plaintext,
 		})
@@ -162,7 +272,35 @@ impl PyTensorDecryptor {
 /// An encoder that encodes data in batches.
 #[pyclass(module = "sealy", name = "CKKSTensorEncoder")]
 pub struct PyCKKSTensorEncoder {
-	inner: sealy::TensorEncoder<sealy::CKKSEncoder>,
+	pub(crate) inner: sealy::TensorEncoder<sealy::CKKSEncoder>,
+	/// Plaintexts holding `1 / n` in every slot, keyed by `n`.
+	reciprocals: Mutex<HashMap<usize, Arc<sealy::Plaintext>>>,
+}
+
+impl PyCKKSTensorEncoder {
+	/// Returns a plaintext holding `1 / n` in every slot. It is encoded on
+	/// first use and cached, since averaging the same number of tensors over
+	/// and over always multiplies by the same plaintext.
+	pub(crate) fn reciprocal(
+		&self,
+		n: usize,
+	) -> PyResult<Arc<sealy::Plaintext>> {
+		if let Some(fraction) = self.reciprocals.lock().unwrap().get(&n) {
+			return Ok(fraction.clone());
+		}
+
+		let fraction = self.inner.encode_scalar_f64(1.0 / n as f64).map_err(|e| {
+			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+				"Failed to encode fraction: {:?}",
+				e
+			))
+		})?;
+
+		let fraction = Arc::new(fraction);
+		self.reciprocals.lock().unwrap().insert(n, fraction.clone());
+
+		Ok(fraction)
+	}
 }
 
 #[pymethods]
@@ -182,6 +320,7 @@ impl PyCKKSTensorEncoder {
 		let inner = sealy::TensorEncoder::new(encoder);
 		Ok(Self {
 			inner,
+			reciprocals: Mutex::new(HashMap::new()),
 		})
 	}
 
@@ -199,19 +338,93 @@ impl PyCKKSTensorEncoder {
 	/// The encoded plaintext.
 	fn encode_float(
 		&self,
+		py: Python<'_>,
 		data: Vec<f64>,
 	) -> PyResult<PyPlaintextTensor> {
-		let batch = self.inner.encode_f64(&data).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to encode batch: {:?}",
-				e
-			))
-		})?;
+		let batch = py
+			.allow_threads(|| self.inner.encode_f64(&data))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encode batch: {:?}",
+					e
+				))
+			})?;
+		Ok(PyPlaintextTensor {
+			inner: batch,
+		})
+	}
+
+	/// Encodes the given buffer of 64-bit floats (e.g. a NumPy `float64` array)
+	/// into a plaintext tensor without converting each element to a Python object.
+	///
+	/// # Arguments
+	/// * `data` - The data to encode.
+	///
+	/// # Returns
+	/// The encoded plaintext.
+	fn encode_float_buffer(
+		&self,
+		py: Python<'_>,
+		data: PyBuffer<f64>,
+	) -> PyResult<PyPlaintextTensor> {
+		// Copied while the GIL is held, so no Python thread can write to the
+		// buffer while it is being encoded.
+		let data = data.to_vec(py)?;
+		let batch = py
+			.allow_threads(|| self.inner.encode_f64(&data))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encode batch: {:?}",
+					e
+				))
+			})?;
 		Ok(PyPlaintextTensor {
 			inner: batch,
 		})
 	}
 
+	/// Encodes each of the given buffers of 64-bit floats (e.g. NumPy `float64`
+	/// arrays) into a plaintext tensor. The buffers are copied while the GIL is
+	/// held, so other threads cannot write to them mid-encode; the GIL is then
+	/// released once and the tensors are encoded in parallel.
+	///
+	/// # Arguments
+	/// * `data` - The tensors to encode.
+	///
+	/// # Returns
+	/// The encoded plaintexts, in the same order as `data`.
+	fn encode_batch(
+		&self,
+		py: Python<'_>,
+		data: Vec<PyBuffer<f64>>,
+	) -> PyResult<Vec<PyPlaintextTensor>> {
+		let encoder = &self.inner;
+		let tensors = data
+			.iter()
+			.map(|buffer| buffer.to_vec(py))
+			.collect::<PyResult<Vec<_>>>()?;
+		let batches = py
+			.allow_threads(|| {
+				tensors
+					.par_iter()
+					.map(|tensor| encoder.encode_f64(tensor))
+					.collect::<sealy::Result<Vec<_>>>()
+			})
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to encode batches: {:?}",
+					e
+				))
+			})?;
+
+		Ok(batches
+			.into_iter()
+			.map(|batch| PyPlaintextTensor {
+				inner: batch,
+			})
+			.collect())
+	}
+
 	/// Decodes the given plaintext into data.
 	///
 	/// # Arguments
@@ -257,14 +470,17 @@ impl PyCKKSTensorEvaluator {
 	/// Negates a batch of ciphertexts.
 	pub fn negate(
 		&self,
+		py: Python<'_>,
 		a: &PyCiphertextTensor,
 	) -> PyResult<PyCiphertextTensor> {
-		let negated = self.inner.negate(&a.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to negate batch: {:?}",
-				e
-			))
-		})?;
+		let negated = py
+			.allow_threads(|| self.inner.negate(&a.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to negate batch: {:?}",
+					e
+				))
+			})?;
 		Ok(PyCiphertextTensor {
 			inner: negated,
 		})
@@ -273,15 +489,18 @@ impl PyCKKSTensorEvaluator {
 	/// Adds two ciphertexts.
 	pub fn add(
 		&self,
+		py: Python<'_>,
 		a: &PyCiphertextTensor,
 		b: &PyCiphertextTensor,
 	) -> PyResult<PyCiphertextTensor> {
-		let sum = self.inner.add(&a.inner, &b.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to add ciphertexts: {:?}",
-				e
-			))
-		})?;
+		let sum = py
+			.allow_threads(|| self.inner.add(&a.inner, &b.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to add ciphertexts: {:?}",
+					e
+				))
+			})?;
 		Ok(PyCiphertextTensor {
 			inner: sum,
 		})
@@ -290,35 +509,114 @@ impl PyCKKSTensorEvaluator {
 	/// Adds many ciphertexts.
 	pub fn add_many(
 		&self,
+		py: Python<'_>,
 		a: Vec<PyCiphertextTensor>,
 	) -> PyResult<PyCiphertextTensor> {
 		let mut ciphertexts = Vec::new();
 		for c in a {
 			ciphertexts.push(c.inner);
 		}
-		let sum = self.inner.add_many(&ciphertexts).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to add many ciphertexts: {:?}",
-				e
-			))
-		})?;
+		let sum = py
+			.allow_threads(|| self.inner.add_many(&ciphertexts))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to add many ciphertexts: {:?}",
+					e
+				))
+			})?;
 		Ok(PyCiphertextTensor {
 			inner: sum,
 		})
 	}
 
+	/// Adds many ciphertexts and writes the sum into `out`, reusing the
+	/// ciphertexts it already holds.
+	pub fn add_many_into(
+		&self,
+		py: Python<'_>,
+		a: Vec<PyRef<PyCiphertextTensor>>,
+		mut out: PyRefMut<PyCiphertextTensor>,
+	) -> PyResult<()> {
+		let ciphertexts: Vec<&sealy::Tensor<sealy::Ciphertext>> =
+			a.iter().map(|c| &c.inner).collect();
+		let out = &mut out.inner;
+		py.allow_threads(|| self.inner.add_many_into(&ciphertexts, out))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to add many ciphertexts: {:?}",
+					e
+				))
+			})
+	}
+
+	/// Computes the element-wise mean of many ciphertexts: the sum is
+	/// multiplied by the `1 / n` plaintext the encoder has cached for `n`.
+	pub fn mean(
+		&self,
+		py: Python<'_>,
+		a: Vec<PyRef<PyCiphertextTensor>>,
+		encoder: &PyCKKSTensorEncoder,
+	) -> PyResult<PyCiphertextTensor> {
+		if a.is_empty() {
+			return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+				"Cannot compute the mean of an empty list of ciphertexts",
+			));
+		}
+
+		let ciphertexts: Vec<&sealy::Tensor<sealy::Ciphertext>> =
+			a.iter().map(|c| &c.inner).collect();
+		let fraction = encoder.reciprocal(ciphertexts.len())?;
+		let mean = py
+			.allow_threads(|| self.inner.add_many_multiply_plain(&ciphertexts, &fraction))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to compute mean of ciphertexts: {:?}",
+					e
+				))
+			})?;
+		Ok(PyCiphertextTensor {
+			inner: mean,
+		})
+	}
+
+	/// Adds many ciphertexts and multiplies every chunk of the sum by the
+	/// given plaintext, one chunk at a time.
+	pub fn add_many_multiply_plain(
+		&self,
+		py: Python<'_>,
+		a: Vec<PyRef<PyCiphertextTensor>>,
+		b: &PyPlaintext,
+	) -> PyResult<PyCiphertextTensor> {
+		let ciphertexts: Vec<&sealy::Tensor<sealy::Ciphertext>> =
+			a.iter().map(|c| &c.inner).collect();
+		let result = py
+			.allow_threads(|| self.inner.add_many_multiply_plain(&ciphertexts, &b.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to add many ciphertexts and multiply by plaintext: {:?}",
+					e
+				))
+			})?;
+		Ok(PyCiphertextTensor {
+			inner: result,
+		})
+	}
+
 	/// Multiplies two ciphertexts.
 	pub fn multiply(
 		&self,
+		py: Python<'_>,
 		a: &PyCiphertextTensor,
 		b: &PyCiphertextTensor,
 	) -> PyResult<PyCiphertextTensor> {
-		let product = self.inner.multiply(&a.inner, &b.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to multiply ciphertexts: {:?}",
-				e
-			))
-		})?;
+		let product = py
+			.allow_threads(|| self.inner.multiply(&a.inner, &b.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to multiply ciphertexts: {:?}",
+					e
+				))
+			})?;
 		Ok(PyCiphertextTensor {
 			inner: product,
 		})
@@ -327,6 +625,7 @@ impl PyCKKSTensorEvaluator {
 	/// Multiplies many ciphertexts.
 	pub fn multiply_many(
 		&self,
+		py: Python<'_>,
 		a: Vec<PyCiphertextTensor>,
 		relin_keys: &PyRelinearizationKey,
 	) -> PyResult<PyCiphertextTensor> {
@@ -334,9 +633,8 @@ impl PyCKKSTensorEvaluator {
 		for c in a {
 			ciphertexts.push(c.inner);
 		}
-		let product = self
-			.inner
-			.multiply_many(&ciphertexts, &relin_keys.inner)
+		let product = py
+			.allow_threads(|| self.inner.multiply_many(&ciphertexts, &relin_keys.inner))
 			.map_err(|e| {
 				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
 					"Failed to multiply many ciphertexts: {:?}",
@@ -351,15 +649,18 @@ impl PyCKKSTensorEvaluator {
 	/// Subtracts two ciphertexts.
 	pub fn sub(
 		&self,
+		py: Python<'_>,
 		a: &PyCiphertextTensor,
 		b: &PyCiphertextTensor,
 	) -> PyResult<PyCiphertextTensor> {
-		let difference = self.inner.sub(&a.inner, &b.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to subtract ciphertexts: {:?}",
-				e
-			))
-		})?;
+		let difference = py
+			.allow_threads(|| self.inner.sub(&a.inner, &b.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to subtract ciphertexts: {:?}",
+					e
+				))
+			})?;
 		Ok(PyCiphertextTensor {
 			inner: difference,
 		})
@@ -368,15 +669,18 @@ impl PyCKKSTensorEvaluator {
 	/// Adds a ciphertext and a plaintext.
 	pub fn add_plain(
 		&self,
+		py: Python<'_>,
 		a: &PyCiphertextTensor,
 		b: &PyPlaintextTensor,
 	) -> PyResult<PyCiphertextTensor> {
-		let sum = self.inner.add_plain(&a.inner, &b.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to add plaintext to ciphertext: {:?}",
-				e
-			))
-		})?;
+		let sum = py
+			.allow_threads(|| self.inner.add_plain(&a.inner, &b.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to add plaintext to ciphertext: {:?}",
+					e
+				))
+			})?;
 		Ok(PyCiphertextTensor {
 			inner: sum,
 		})
@@ -385,15 +689,18 @@ impl PyCKKSTensorEvaluator {
 	/// Subtracts a plaintext from a ciphertext.
 	pub fn sub_plain(
 		&self,
+		py: Python<'_>,
 		a: &PyCiphertextTensor,
 		b: &PyPlaintextTensor,
 	) -> PyResult<PyCiphertextTensor> {
-		let difference = self.inner.sub_plain(&a.inner, &b.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to subtract plaintext from ciphertext: {:?}",
-				e
-			))
-		})?;
+		let difference = py
+			.allow_threads(|| self.inner.sub_plain(&a.inner, &b.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to subtract plaintext from ciphertext: {:?}",
+					e
+				))
+			})?;
 		Ok(PyCiphertextTensor {
 			inner: difference,
 		})
@@ -402,15 +709,18 @@ impl PyCKKSTensorEvaluator {
 	/// Multiplies a ciphertext by a plaintext.
 	pub fn multiply_plain(
 		&self,
+		py: Python<'_>,
 		a: &PyCiphertextTensor,
 		b: &PyPlaintextTensor,
 	) -> PyResult<PyCiphertextTensor> {
-		let product = self.inner.multiply_plain(&a.inner, &b.inner).map_err(|e| {
-			PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
-				"Failed to multiply ciphertext by plaintext: {:?}",
-				e
-			))
-		})?;
+		let product = py
+			.allow_threads(|| self.inner.multiply_plain(&a.inner, &b.inner))
+			.map_err(|e| {
+				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
+					"Failed to multiply ciphertext by plaintext: {:?}",
+					e
+				))
+			})?;
 		Ok(PyCiphertextTensor {
 			inner: product,
 		})
@@ -418,12 +728,12 @@ impl PyCKKSTensorEvaluator {
 
 	pub fn relinearize(
 		&self,
+		py: Python<'_>,
 		a: &PyCiphertextTensor,
 		relin_keys: &PyRelinearizationKey,
 	) -> PyResult<PyCiphertextTensor> {
-		let relinearized = self
-			.inner
-			.relinearize(&a.inner, &relin_keys.inner)
+		let relinearized = py
+			.allow_threads(|| self.inner.relinearize(&a.inner, &relin_keys.inner))
 			.map_err(|e| {
 				PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!(
 					"Failed to relinearize ciphertext: {:?}",
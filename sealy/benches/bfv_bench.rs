@@ -11,15 +11,10 @@ fn generate_clients_gradients(
 	num_clients: usize,
 	tensor_dim: usize,
 ) -> Vec<Vec<f64>> {
-	let mut clients = Vec::with_capacity(num_clients);
-	for _ in 0..num_clients {
-		let mut tensor = Vec::with_capacity(tensor_dim);
-		for _ in 0..tensor_dim {
-			tensor.push(rand::thread_rng().gen_range(0.0..1.0));
-		}
-		clients.push(tensor);
-	}
-	clients
+	let mut rng = rand::thread_rng();
+	(0..num_clients)
+		.map(|_| (0..tensor_dim).map(|_| rng.gen_range(0.0..1.0)).collect())
+		.collect()
 }
 
 fn create_bfv_context(
@@ -111,6 +106,15 @@ fn criterion_benchmark(c: &mut Criterion) {
 			)
 		})
 	});
+
+	// Ciphertext multiplication is dominated by SEAL's dyadic products, which
+	// use HEXL's lazily reduced kernels when built with the `hexl` feature.
+	let evaluator = BFVEvaluator::new(&ctx).expect("Failed to create evaluator");
+
+	println!("Benchmarking BFV multiply 16k...");
+	c.bench_function("multiply 16k BFV", |b| {
+		b.iter(|| evaluator.multiply(black_box(&ciphertexts[0]), black_box(&ciphertexts[1])))
+	});
 }
 
 criterion_group!(benches, criterion_benchmark);
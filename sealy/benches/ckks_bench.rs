@@ -11,15 +11,10 @@ fn generate_clients_gradients(
 	num_clients: usize,
 	tensor_dim: usize,
 ) -> Vec<Vec<f64>> {
-	let mut clients = Vec::with_capacity(num_clients);
-	for _ in 0..num_clients {
-		let mut tensor = Vec::with_capacity(tensor_dim);
-		for _ in 0..tensor_dim {
-			tensor.push(rand::thread_rng().gen_range(0.0..1.0));
-		}
-		clients.push(tensor);
-	}
-	clients
+	let mut rng = rand::thread_rng();
+	(0..num_clients)
+		.map(|_| (0..tensor_dim).map(|_| rng.gen_range(0.0..1.0)).collect())
+		.collect()
 }
 
 fn create_ckks_context(
@@ -67,9 +67,18 @@ impl Ciphertext {
 		size
 	}
 
+	/// Returns the degree of the polynomials in this ciphertext.
+	pub fn poly_modulus_degree(&self) -> u64 {
+		let mut degree: u64 = 0;
+
+		try_seal!(unsafe { bindgen::Ciphertext_PolyModulusDegree(self.get_handle(), &mut degree) })
+			.unwrap();
+
+		degree
+	}
+
 	/// Returns the value at a specific point in the coefficient array. This is
 	/// not publically exported as it leaks the encoding of the array.
-	#[allow(dead_code)]
 	pub(crate) fn get_data(
 		&self,
 		index: usize,
@@ -83,6 +92,24 @@ impl Ciphertext {
 		Ok(value)
 	}
 
+	/// Copies out every coefficient of this ciphertext in SEAL's layout: one
+	/// polynomial after the other, each stored as one block of
+	/// `poly_modulus_degree` coefficients per component of the coefficient
+	/// modulus.
+	///
+	/// The SEAL C API has no bulk accessor for ciphertext data, so this makes
+	/// one FFI call per coefficient: `num_polynomials * coeff_modulus_size *
+	/// poly_modulus_degree` calls, e.g. 49152 for a fresh ciphertext with an
+	/// 8192-degree modulus of three data primes. It is meant for inspection,
+	/// not for hot paths.
+	pub fn as_u64s(&self) -> Result<Vec<u64>> {
+		let len = self.num_polynomials() * self.coeff_modulus_size() * self.poly_modulus_degree();
+
+		(0..len as usize)
+			.map(|index| self.get_data(index))
+			.collect()
+	}
+
 	/// Returns the coefficient in the form the ciphertext is currently in (NTT
 	/// form or not). For BFV, this will be the coefficient in the residual
 	/// number system (RNS) format.
@@ -143,6 +170,16 @@ impl Clone for Ciphertext {
 			handle: AtomicPtr::new(handle),
 		}
 	}
+
+	/// Copies `source` into this ciphertext, reusing its allocation when it is
+	/// large enough.
+	fn clone_from(
+		&mut self,
+		source: &Self,
+	) {
+		try_seal!(unsafe { bindgen::Ciphertext_Set(self.get_handle(), source.get_handle()) })
+			.expect("Fatal error: Failed to copy ciphertext");
+	}
 }
 
 impl AsRef<Ciphertext> for Ciphertext {
@@ -226,6 +263,10 @@ impl Drop for Ciphertext {
 #[cfg(test)]
 mod tests {
 	use super::*;
+	use crate::{
+		CKKSEncoder, CKKSEncryptionParametersBuilder, CoefficientModulusFactory, DegreeType,
+		Encryptor, KeyGenerator, SecurityLevel,
+	};
 
 	#[test]
 	fn can_create_and_destroy_ciphertext() {
@@ -233,4 +274,37 @@ mod tests {
 
 		std::mem::drop(ciphertext);
 	}
+
+	#[test]
+	fn can_clone_from_ciphertext() {
+		let params = CKKSEncryptionParametersBuilder::new()
+			.set_poly_modulus_degree(DegreeType::D8192)
+			.set_coefficient_modulus(
+				CoefficientModulusFactory::build(DegreeType::D8192, &[60, 40, 40, 60]).unwrap(),
+			)
+			.build()
+			.unwrap();
+
+		let ctx = Context::new(&params, false, SecurityLevel::TC128).unwrap();
+		let gen = KeyGenerator::new(&ctx).unwrap();
+		let encoder = CKKSEncoder::new(&ctx, 2.0f64.powi(40)).unwrap();
+		let encryptor = Encryptor::with_public_key(&ctx, &gen.create_public_key()).unwrap();
+
+		let a = encryptor
+			.encrypt(&encoder.encode_f64(&[1.0, 2.0, 3.0]).unwrap())
+			.unwrap();
+		let b = encryptor
+			.encrypt(&encoder.encode_f64(&[4.0, 5.0]).unwrap())
+			.unwrap();
+
+		// Into an empty ciphertext.
+		let mut c = Ciphertext::new().unwrap();
+		c.clone_from(&a);
+		assert_eq!(c, a);
+
+		// Into a ciphertext that already holds data.
+		c.clone_from(&b);
+		assert_eq!(c, b);
+		assert_ne!(c, a);
+	}
 }
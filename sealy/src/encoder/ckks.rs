@@ -101,6 +101,37 @@ impl CKKSEncoder {
 		Ok(plaintext)
 	}
 
+	/// Creates a plaintext holding `value` in every slot.
+	///
+	/// The encoded polynomial is constant, so SEAL writes the scaled value
+	/// straight into each RNS component without running the inverse FFT and
+	/// the NTTs that encoding a full vector needs.
+	///
+	///  * `value` - The value to encode
+	pub fn encode_scalar_f64(
+		&self,
+		value: f64,
+	) -> Result<Plaintext> {
+		let mem = MemoryPool::new()?;
+
+		let plaintext = Plaintext::new()?;
+
+		try_seal!(unsafe {
+			let mut parms_id = self.parms_id.clone();
+			let parms_id_ptr = parms_id.as_mut_ptr();
+			bindgen::CKKSEncoder_Encode3(
+				self.get_handle(),
+				value,
+				parms_id_ptr,
+				self.scale,
+				plaintext.get_handle(),
+				mem.get_handle(),
+			)
+		})?;
+
+		Ok(plaintext)
+	}
+
 	/// Inverse of encode. This function decodes a given plaintext into
 	/// a list of f64 elements.
 	///
@@ -295,6 +326,20 @@ mod tests {
 		float_assert_eq(decoded[0], 42.0);
 	}
 
+	/// Test that encoding a scalar fills every slot with it.
+	#[test]
+	fn can_encode_scalar_into_every_slot() {
+		let ctx = create_ckks_context(DegreeType::D8192, &[60, 40, 40, 60]).unwrap();
+
+		let encoder = CKKSEncoder::new(&ctx, 2.0f64.powi(40)).unwrap();
+
+		let encoded = encoder.encode_scalar_f64(1.0 / 3.0).unwrap();
+		let decoded: Vec<f64> = encoder.decode_f64(&encoded).unwrap();
+
+		assert_eq!(decoded.len(), encoder.get_slot_count());
+		float_iter_assert_eq(decoded, std::iter::repeat(1.0 / 3.0));
+	}
+
 	/// Test encoding and decoding a float vector. CKKS handles floating-point numbers, so this is expected to work.
 	#[test]
 	fn can_get_encode_and_decode_float() {
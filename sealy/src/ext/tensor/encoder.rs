@@ -40,6 +40,21 @@ impl TensorEncoder<CKKSEncoder> {
 		Ok(Tensor(plaintexts))
 	}
 
+	/// Encodes the given value into every slot of a single plaintext, which
+	/// can be used against every chunk of a tensor.
+	///
+	/// # Arguments
+	/// * `value` - The value to encode.
+	///
+	/// # Returns
+	/// The encoded plaintext.
+	pub fn encode_scalar_f64(
+		&self,
+		value: f64,
+	) -> Result<Plaintext> {
+		self.encoder.encode_scalar_f64(value)
+	}
+
 	/// Decodes the given plaintext into data.
 	///
 	/// # Arguments
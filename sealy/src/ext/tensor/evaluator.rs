@@ -1,5 +1,8 @@
 use super::Tensor;
-use crate::{CKKSEvaluator, Context, Error, Evaluator, GaloisKey, RelinearizationKey, Result};
+use crate::{
+	CKKSEvaluator, Ciphertext, Context, Error, Evaluator, GaloisKey, Plaintext, RelinearizationKey,
+	Result,
+};
 
 /// An evaluator that evaluates a tensor of data.
 pub struct TensorEvaluator<E> {
@@ -16,6 +19,63 @@ where
 			evaluator,
 		}
 	}
+
+	/// Sums the given ciphertext tensors into `out`.
+	///
+	/// `out` is overwritten with the first tensor and the others are added to
+	/// it in place, so an accumulator reused across calls keeps its ciphertext
+	/// allocations instead of getting a fresh sum tensor every time.
+	///
+	/// # Arguments
+	/// * `a` - The ciphertext tensors to sum.
+	/// * `out` - The tensor the sum is written to.
+	pub fn add_many_into(
+		&self,
+		a: &[&Tensor<E::Ciphertext>],
+		out: &mut Tensor<E::Ciphertext>,
+	) -> Result<()>
+	where
+		E::Ciphertext: Clone,
+	{
+		let (first, rest) = a.split_first().ok_or_else(|| Error::InvalidArgument)?;
+
+		if rest.iter().any(|tensor| tensor.len() != first.len()) {
+			return Err(Error::InvalidArgument);
+		}
+
+		out.0.clone_from(&first.0);
+
+		for tensor in rest {
+			for (sum, value) in out.iter_mut().zip(tensor.iter()) {
+				self.evaluator.add_inplace(sum, value)?;
+			}
+		}
+
+		Ok(())
+	}
+
+	/// Sums the chunk at `index` of every tensor. Only the first tensor's chunk
+	/// is cloned; the others are added to it in place.
+	fn add_chunk(
+		&self,
+		a: &[&Tensor<E::Ciphertext>],
+		index: usize,
+	) -> Result<E::Ciphertext>
+	where
+		E::Ciphertext: Clone,
+	{
+		let (first, rest) = a.split_first().ok_or_else(|| Error::InvalidArgument)?;
+		let mut sum = first
+			.get_cloned(index)
+			.ok_or_else(|| Error::InvalidArgument)?;
+
+		for tensor in rest {
+			let value = tensor.get(index).ok_or_else(|| Error::InvalidArgument)?;
+			self.evaluator.add_inplace(&mut sum, value)?;
+		}
+
+		Ok(sum)
+	}
 }
 
 impl TensorEvaluator<CKKSEvaluator> {
@@ -25,6 +85,33 @@ impl TensorEvaluator<CKKSEvaluator> {
 			evaluator: CKKSEvaluator::new(ctx)?,
 		})
 	}
+
+	/// Sums the given ciphertext tensors and multiplies every chunk of the sum
+	/// by the same plaintext.
+	///
+	/// Each chunk is summed and multiplied before moving to the next one, so
+	/// the partial sum is still in cache when it is multiplied and no
+	/// intermediate sum tensor is materialized.
+	///
+	/// # Arguments
+	/// * `a` - The ciphertext tensors to sum.
+	/// * `b` - The plaintext each chunk of the sum is multiplied by.
+	pub fn add_many_multiply_plain(
+		&self,
+		a: &[&Tensor<Ciphertext>],
+		b: &Plaintext,
+	) -> Result<Tensor<Ciphertext>> {
+		let length = a.first().ok_or_else(|| Error::InvalidArgument)?.len();
+		let mut result = Vec::with_capacity(length);
+
+		for i in 0..length {
+			let mut sum = self.add_chunk(a, i)?;
+			self.evaluator.multiply_plain_inplace(&mut sum, b)?;
+			result.push(sum);
+		}
+
+		Ok(Tensor(result))
+	}
 }
 
 impl<E> Evaluator for TensorEvaluator<E>
@@ -83,18 +170,12 @@ where
 		&self,
 		a: &[Self::Ciphertext],
 	) -> Result<Self::Ciphertext> {
+		let a: Vec<&Self::Ciphertext> = a.iter().collect();
 		let mut result = Vec::with_capacity(a.len());
 		let length = a.first().ok_or_else(|| Error::InvalidArgument)?.len();
 
 		for i in 0..length {
-			let mut values = Vec::with_capacity(a.len());
-
-			for tensor in a.iter() {
-				let value = tensor.get_cloned(i).ok_or_else(|| Error::InvalidArgument)?;
-				values.push(value);
-			}
-
-			result.push(self.evaluator.add_many(values.as_slice())?);
+			result.push(self.add_chunk(&a, i)?);
 		}
 
 		Ok(Tensor(result))
@@ -372,3 +453,127 @@ where
 		Ok(())
 	}
 }
+
+#[cfg(test)]
+mod tests {
+	use crate::*;
+
+	fn float_assert_eq(
+		a: f64,
+		b: f64,
+	) {
+		assert!((a - b).abs() < 0.0001);
+	}
+
+	fn run_tensor_test<F>(test: F)
+	where
+		F: FnOnce(
+			TensorDecryptor,
+			TensorEncoder<CKKSEncoder>,
+			TensorEncryptor<Asym>,
+			TensorEvaluator<CKKSEvaluator>,
+		),
+	{
+		let params = CKKSEncryptionParametersBuilder::new()
+			.set_poly_modulus_degree(DegreeType::D8192)
+			.set_coefficient_modulus(
+				CoefficientModulusFactory::build(DegreeType::D8192, &[60, 40, 40, 60]).unwrap(),
+			)
+			.build()
+			.unwrap();
+
+		let ctx = Context::new(&params, false, SecurityLevel::TC128).unwrap();
+		let gen = KeyGenerator::new(&ctx).unwrap();
+
+		let encoder = TensorEncoder::new(CKKSEncoder::new(&ctx, 2.0f64.powi(40)).unwrap());
+
+		let public_key = gen.create_public_key();
+		let secret_key = gen.secret_key();
+
+		let encryptor = TensorEncryptor::with_public_key(&ctx, &public_key).unwrap();
+		let decryptor = TensorDecryptor::new(&ctx, &secret_key).unwrap();
+		let evaluator = TensorEvaluator::ckks(&ctx).unwrap();
+
+		test(decryptor, encoder, encryptor, evaluator);
+	}
+
+	/// Makes data spanning more than one chunk, so the tensor has several
+	/// ciphertexts.
+	fn make_vec(
+		encoder: &TensorEncoder<CKKSEncoder>,
+		offset: f64,
+	) -> Vec<f64> {
+		(0..encoder.get_slot_count() + 10)
+			.map(|i| offset + (i % 32) as f64)
+			.collect()
+	}
+
+	#[test]
+	fn can_add_many_into() {
+		run_tensor_test(|decryptor, encoder, encryptor, evaluator| {
+			let a = make_vec(&encoder, 1.0);
+			let b = make_vec(&encoder, -3.0);
+			let a_c = encryptor.encrypt(&encoder.encode_f64(&a).unwrap()).unwrap();
+			let b_c = encryptor.encrypt(&encoder.encode_f64(&b).unwrap()).unwrap();
+
+			let mut out = Tensor(Vec::new());
+			evaluator.add_many_into(&[&a_c, &b_c], &mut out).unwrap();
+
+			// The accumulator is reused on the second call.
+			evaluator
+				.add_many_into(&[&a_c, &b_c, &a_c], &mut out)
+				.unwrap();
+
+			assert_eq!(out.len(), a_c.len());
+
+			let sum = encoder
+				.decode_f64(&decryptor.decrypt(&out).unwrap())
+				.unwrap();
+
+			for i in 0..a.len() {
+				float_assert_eq(sum[i], 2.0 * a[i] + b[i]);
+			}
+		});
+	}
+
+	#[test]
+	fn add_many_into_rejects_mismatched_tensors() {
+		run_tensor_test(|_, encoder, encryptor, evaluator| {
+			let a = make_vec(&encoder, 1.0);
+			let a_c = encryptor.encrypt(&encoder.encode_f64(&a).unwrap()).unwrap();
+			let b_c = encryptor
+				.encrypt(&encoder.encode_f64(&a[..10]).unwrap())
+				.unwrap();
+
+			let mut out = Tensor(Vec::new());
+
+			assert!(evaluator.add_many_into(&[], &mut out).is_err());
+			assert!(evaluator.add_many_into(&[&a_c, &b_c], &mut out).is_err());
+		});
+	}
+
+	#[test]
+	fn can_add_many_multiply_plain() {
+		run_tensor_test(|decryptor, encoder, encryptor, evaluator| {
+			let a = make_vec(&encoder, 1.0);
+			let b = make_vec(&encoder, -3.0);
+			let a_c = encryptor.encrypt(&encoder.encode_f64(&a).unwrap()).unwrap();
+			let b_c = encryptor.encrypt(&encoder.encode_f64(&b).unwrap()).unwrap();
+
+			let factor = encoder.encode_scalar_f64(0.5).unwrap();
+			let result = evaluator
+				.add_many_multiply_plain(&[&a_c, &b_c], &factor)
+				.unwrap();
+
+			assert_eq!(result.len(), a_c.len());
+
+			let result = encoder
+				.decode_f64(&decryptor.decrypt(&result).unwrap())
+				.unwrap();
+
+			for i in 0..a.len() {
+				float_assert_eq(result[i], 0.5 * (a[i] + b[i]));
+			}
+		});
+	}
+}